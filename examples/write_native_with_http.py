@@ -1,48 +1,28 @@
-from typing import NamedTuple
-from native_transfer import NativeTransfer
-from requests import post
-from uuid import uuid4
-
-
-class Connect(NamedTuple):
-    host: str
-    port: int
-    database: str
-    user: str
-    password: str
+from functools import partial
 
+from native_transfer import (
+    HttpInsert,
+    NativeTransfer,
+    StreamMethod,
+)
 
-ch_conn = Connect("localhost", 8123, "default", "default", "")
 
 nt = NativeTransfer()
 data = nt.open(
     "test.native.gz", "rb"
-)  # pack native into gzip format and open it with NativeTransfer.open
+)  # gzip, zstd and LZ4 frame files are decompressed by NativeTransfer.open
 
 # create table test_table with columns such your native file
 
-headers = {
-    "X-ClickHouse-User": ch_conn.user,
-    "X-ClickHouse-Key": ch_conn.password,
-    "X-Content-Type-Options": "nosniff",
-    "X-ClickHouse-Format": "Native",
-    "Content-Encoding": "gzip",
-}
-
-url: str = (
-    f"http://{ch_conn.host}:8123/?enable_http_compression=1"
-    "&http_zlib_compression_level=9"
-)
-params = {
-    "database": ch_conn.database,
-    "query": "INSERT INTO test_table FORMAT Native",
-    "session_id": str(uuid4()),
-}
-resp = post(
-    url=url,
-    headers=headers,
-    data=data.read(),
-    params=params,
-    timeout=600,
-)
-print(resp)  # 200
+with HttpInsert(
+    url="http://localhost:8123",
+    user="default",
+    password="",
+    database="default",
+    content_encoding=StreamMethod.ZSTD,
+    settings={"enable_http_compression": "1"},
+) as client:
+    # the file is already Native: its decompressed bytes are sent
+    # in 1 MiB chunks with chunked transfer encoding as they are read,
+    # column types are kept and the whole payload is never in memory
+    print(client.insert("test_table", iter(partial(data.read, 1 << 20), b"")))
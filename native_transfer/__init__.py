@@ -1,23 +1,42 @@
+from asyncio import get_running_loop
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from gzip import GzipFile
 from io import (
     BufferedIOBase,
     BufferedReader,
     BufferedWriter,
     BytesIO,
+    SEEK_END,
 )
 from logging import (
     Logger,
     getLogger,
 )
 from os import PathLike
+from itertools import chain
 from struct import error as EOF
+from time import (
+    perf_counter,
+    sleep,
+)
 from typing import (
+    Any,
+    AsyncGenerator,
+    Deque,
+    Generator,
+    Iterable,
     List,
     Optional,
     Union,
     TYPE_CHECKING,
 )
+from uuid import uuid4
 
+from numpy import ndarray
 from pandas import (
     concat as pd_concat,
     Series as PdSeries,
@@ -26,11 +45,24 @@ from pandas import (
 from polars import (
     concat as pl_concat,
     DataFrame as PlFrame,
+    LazyFrame,
 )
 
-from .chunks import chunk_frame
+from .aio import (
+    AsyncReader,
+    AsyncWriter,
+)
+from .chunks import (
+    chunk_frame,
+    frame_batches,
+    shard_frame,
+)
 from .compress import (
+    BLOCK_SIZE,
+    CACHE_BLOCKS,
+    BlockHeader,
     BlockStruct,
+    ChecksumPolicy,
     CompressCodec,
     CompressionMethod,
     FileBlocks,
@@ -39,10 +71,15 @@ from .compress import (
     NativeCompressFile,
     NativeCompressFileError,
     NativeCompressFormatNotSupport,
+    NativeCompressHashError,
     NativeCompressMethodNotSupport,
     NativeCompressPackError,
+    block_length,
+    decompress_blocks,
+    recompress,
 )
-from .dtypes import get_dtype
+from .defaults import null_map
+from .dtypes import compile_dtype
 from .dtypes.strings import (
     read_string,
     write_string,
@@ -53,6 +90,7 @@ from .errors import (
     NativeDTypeError,
     NativeError,
     NativeEnumError,
+    NativeHttpError,
     NativePrecissionError,
     NativeReadError,
     NativeWriteError,
@@ -62,13 +100,43 @@ from .info import (
     DataFormat,
     DataInfo,
     FORMAT_VALUES,
+    STREAM_VALUES,
     get_info,
 )
 from .lens import (
     read_lens,
     write_lens,
 )
-from .pytypes import dtype_from_frame
+from .http_client import (
+    RETRY_DELAY,
+    BlockCounter,
+    HttpInsert,
+    InsertReport,
+    ShardResult,
+    retryable,
+)
+from .gzip_index import (
+    READ_SIZE,
+    GzipIndex,
+    sidecar_index,
+)
+from .streams import (
+    LOOKAHEAD_SIZE,
+    ForwardCursor,
+    StreamMethod,
+    StreamReader,
+    StreamWriter,
+    decompress_chunks,
+    detect_stream,
+    file_chunks,
+    forward_only,
+)
+from .pytypes import (
+    SAMPLE_ROWS,
+    SampleStrategy,
+    dtype_from_frame,
+    stream_dtype,
+)
 from .readme import readme
 
 if TYPE_CHECKING:
@@ -78,18 +146,24 @@ if TYPE_CHECKING:
 
 
 __all__ = (
+    "BlockHeader",
     "BlockStruct",
+    "ChecksumPolicy",
     "CompressCodec",
     "CompressionMethod",
     "DataFormat",
     "DataInfo",
     "FileBlocks",
     "FrameType",
+    "GzipIndex",
+    "HttpInsert",
+    "InsertReport",
     "NativeCompressError",
     "NativeCompressExtractError",
     "NativeCompressFile",
     "NativeCompressFileError",
     "NativeCompressFormatNotSupport",
+    "NativeCompressHashError",
     "NativeCompressMethodNotSupport",
     "NativeCompressPackError",
     "NativeDTypeError",
@@ -97,13 +171,19 @@ __all__ = (
     "NativeDateTimeError",
     "NativeEnumError",
     "NativeError",
+    "NativeHttpError",
     "NativePrecissionError",
     "NativeReadError",
     "NativeTransfer",
     "NativeWriteError",
+    "SampleStrategy",
+    "StreamMethod",
+    "StreamReader",
+    "StreamWriter",
+    "recompress",
 )
 __doc__ = readme
-__version__ = "0.0.4"
+__version__ = "0.0.5"
 
 
 class NativeTransfer:
@@ -118,6 +198,13 @@ class NativeTransfer:
         make_compress: bool = False,
         compress_method: CompressionMethod = CompressionMethod.NONE,
         compress_level: int = 0,
+        compress_frame_size: int = BLOCK_SIZE,
+        compress_workers: int = 1,
+        compress_dictionary: Optional[Union[str, PathLike]] = None,
+        compress_cache_blocks: int = CACHE_BLOCKS,
+        checksum_policy: ChecksumPolicy = ChecksumPolicy.Verify,
+        sample_rows: int = SAMPLE_ROWS,
+        sample_strategy: SampleStrategy = SampleStrategy.Head,
     ) -> None:
         """Class initialization."""
 
@@ -128,12 +215,21 @@ class NativeTransfer:
 
         self.block_rows = block_rows
         self.make_compress = make_compress
+        self.compress_frame_size = compress_frame_size
+        self.compress_workers = compress_workers
+        self.compress_cache_blocks = compress_cache_blocks
+        self.checksum_policy = checksum_policy
+        self.sample_rows = sample_rows
+        self.sample_strategy = sample_strategy
         self.codec = CompressCodec(
             default_method=compress_method,
             default_level=compress_level,
         )
         self.logs = logs
 
+        if compress_dictionary:
+            self.codec.load_dictionary(compress_dictionary)
+
         self.logs.info(
             f"NativeTransfer initialized with {self.block_rows} block rows."
         )
@@ -156,9 +252,24 @@ class NativeTransfer:
         self: "NativeTransfer",
         file: Union[BufferedIOBase, GzipFile],
     ) -> Union[BufferedIOBase, GzipFile, NativeCompressFile]:
-        """Return NativeCompressFile if compressed."""
+        """Return NativeCompressFile if the first block
+        is a valid compressed block."""
 
-        if file.__class__ == GzipFile:
+        if file.__class__ in (GzipFile, StreamReader):
+            return file
+
+        if isinstance(file, ForwardCursor):
+            return self.check_forward(file)
+
+        size = block_length(file.read(25))
+        file_size = file.seek(0, SEEK_END)
+        file.seek(0)
+        is_compressed = 0 < size <= file_size and BlockStruct.from_buffer(
+            file.read(size)
+        ).is_valid
+        file.seek(0)
+
+        if not is_compressed:
             return file
 
         try:
@@ -166,12 +277,40 @@ class NativeTransfer:
                 file=file,
                 codec=self.codec,
                 logs=self.logs,
+                workers=self.compress_workers,
+                checksum_policy=self.checksum_policy,
+                cache_blocks=self.compress_cache_blocks,
             )
         except ValueError:
             """Not a compressed file."""
             file.seek(0)
             return file
 
+    def check_forward(
+        self: "NativeTransfer",
+        file: ForwardCursor,
+    ) -> ForwardCursor:
+        """Return cursor over decompressed blocks if the first block
+        of forward-only stream is a valid compressed block."""
+
+        size = block_length(file.lookahead(25))
+
+        if not 0 < size <= LOOKAHEAD_SIZE:
+            return file
+
+        if not BlockStruct.from_buffer(file.lookahead(size)).is_valid:
+            return file
+
+        return ForwardCursor(
+            decompress_blocks(
+                file_chunks(file),
+                self.codec,
+                self.checksum_policy,
+                self.logs,
+            ),
+            file.name,
+        )
+
     def extract_block(
         self: "NativeTransfer",
         file: Union[BufferedIOBase, GzipFile, NativeCompressFile],
@@ -187,14 +326,18 @@ class NativeTransfer:
             for _ in range(num_columns):
                 name: str = read_string(file)
                 raw_string: str = read_string(file)
-                block: Union[Array, DType, LowCardinality] = get_dtype(
-                    raw_string, total_rows
+                block: Union[Array, DType, LowCardinality] = compile_dtype(
+                    raw_string
                 )
 
                 if frame_type == FrameType.Pandas:
-                    frames.append(PdSeries(data=block.read(file), name=name))
+                    frames.append(
+                        PdSeries(data=block.read(file, total_rows), name=name)
+                    )
                 elif frame_type == FrameType.Polars:
-                    frames.append(PlFrame({name: block.read(file)}))
+                    frames.append(
+                        PlFrame({name: block.read(file, total_rows)})
+                    )
 
             if frame_type == FrameType.Pandas:
                 return pd_concat(frames, axis=1)
@@ -236,9 +379,142 @@ class NativeTransfer:
         elif frame_type == FrameType.Polars:
             return pl_concat(data_frames, how="vertical")
 
-    def make(
+    def iter_blocks(
+        self: "NativeTransfer",
+        chunks: Iterable[bytes],
+        frame_type: FrameType = FrameType.Pandas,
+        compressed: bool = False,
+        content_encoding: Optional[StreamMethod] = None,
+    ) -> Generator[Union[PdFrame, PlFrame], None, None]:
+        """Read Native Format from iterator of byte chunks without seeking,
+        every block is returned as soon as it is complete."""
+
+        if content_encoding:
+            chunks = decompress_chunks(chunks, content_encoding)
+
+        if compressed:
+            chunks = decompress_blocks(
+                chunks,
+                self.codec,
+                self.checksum_policy,
+                self.logs,
+            )
+
+        file = ForwardCursor(chunks)
+
+        while file.lookahead(1):
+            try:
+                frame = self.extract_block(file, frame_type)
+            except EOF as err:
+                msg = f"Native stream ended inside a block: {err}"
+                self.logs.error(msg)
+                raise NativeReadError(msg)
+
+            yield frame
+
+    def check_nulls(
         self: "NativeTransfer",
         frame: Union[PdFrame, PlFrame],
+        blocks: List[Union["Array", "DType", "LowCardinality"]],
+        dtypes: List[str],
+    ) -> None:
+        """Check the next DataFrame of an iterator has no NULL values
+        in columns inferred as not Nullable from the first one."""
+
+        for idx, column in enumerate(frame.columns):
+            # only plain DType has nullables, None if not Nullable
+            if getattr(blocks[idx], "nullables", False) is None and (
+                null_map(frame[column]).any()
+            ):
+                msg = (
+                    f"Column {column} has NULL values, but its data type "
+                    f"{dtypes[idx]} inferred from the first DataFrame "
+                    "is not Nullable. Pass dtypes for all DataFrames."
+                )
+                raise NativeWriteError(msg)
+
+    def make_blocks(
+        self: "NativeTransfer",
+        frame: Union[PdFrame, PlFrame, Iterable[Union[PdFrame, PlFrame]]],
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[List[str]] = None,
+    ) -> Generator[bytes, None, None]:
+        """Encode polars/pandas DataFrame or iterator of DataFrames
+        into Native blocks."""
+
+        is_stream: bool = not isinstance(frame, Union[PdFrame, PlFrame])
+        is_inferred: bool = not dtypes
+
+        if not is_stream:
+            frame = (frame,)
+
+        blocks: List[Union[Array, DType, LowCardinality]] = []
+        names: List[str] = []
+
+        for data_frame in frame:
+            if names and list(data_frame.columns) != names:
+                msg = (
+                    f"Columns {list(data_frame.columns)} differ "
+                    f"from the first DataFrame columns {names}."
+                )
+                raise NativeWriteError(msg)
+
+            if blocks and is_inferred:
+                self.check_nulls(data_frame, blocks, dtypes)
+
+            if not blocks:
+                names = list(data_frame.columns)
+
+                if not columns:
+                    self.logs.warning(
+                        "No columns found. Get column names "
+                        "from DataFrame operation started."
+                    )
+                    columns: List[str] = list(data_frame.columns)
+                    self.logs.warning(
+                        "Get column names from DataFrame operation success."
+                    )
+                self.logs.info(f"Columns for write: {columns}")
+
+                if not dtypes:
+                    self.logs.warning(
+                        "No data types found. Get data types "
+                        "from DataFrame operation started."
+                    )
+                    dtypes: List[str] = dtype_from_frame(
+                        data_frame, self.sample_rows, self.sample_strategy
+                    )
+
+                    if is_stream:
+                        dtypes = [stream_dtype(dtype) for dtype in dtypes]
+                    self.logs.warning(
+                        "Get data types from DataFrame operation success."
+                    )
+                self.logs.info(f"Data Types for write: {dtypes}")
+
+                blocks = [compile_dtype(raw_string) for raw_string in dtypes]
+
+            for df in chunk_frame(data_frame, self.block_rows):
+                buffer = BytesIO()
+                write_lens(len(columns), buffer)
+                write_lens(len(df), buffer)
+
+                for idx, column in enumerate(df.columns):
+                    write_string(columns[idx], buffer)
+                    write_string(dtypes[idx], buffer)
+                    nulls: Optional[ndarray] = None
+
+                    if getattr(blocks[idx], "nullables", None):
+                        nulls = null_map(df[column])
+
+                    blocks[idx].write(df[column].to_list(), buffer, nulls)
+
+                yield buffer.getvalue()
+                del df
+
+    def make(
+        self: "NativeTransfer",
+        frame: Union[PdFrame, PlFrame, Iterable[Union[PdFrame, PlFrame]]],
         file: Union[BufferedIOBase, GzipFile],
         columns: Optional[List[str]] = None,
         dtypes: Optional[List[str]] = None,
@@ -250,62 +526,241 @@ class NativeTransfer:
                 file=file,
                 codec=self.codec,
                 logs=self.logs,
+                frame_size=self.compress_frame_size,
+                workers=self.compress_workers,
             )
 
-        buffer = BytesIO()
-
         try:
             self.logs.info(
                 f"Create native file {file.name} from DataFrame started."
             )
-            if not columns:
-                self.logs.warning(
-                    "No columns found. Get column names "
-                    "from DataFrame operation started."
-                )
-                columns: List[str] = list(frame.columns)
+
+            for block in self.make_blocks(frame, columns, dtypes):
+                file.write(block)
+
+            if self.make_compress:
+                file.shutdown()
+            self.logs.info(
+                f"Create native file {file.name} from DataFrame success."
+            )
+        except Exception as err:
+            self.logs.error(err)
+            raise NativeWriteError(err)
+        finally:
+            if self.make_compress:
+                file.shutdown()
+
+    def insert(
+        self: "NativeTransfer",
+        frame: Union[PdFrame, PlFrame, Iterable[Union[PdFrame, PlFrame]]],
+        client: HttpInsert,
+        table: str,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[List[str]] = None,
+    ) -> str:
+        """Stream polars/pandas DataFrame or iterator of DataFrames
+        into Clickhouse table block by block."""
+
+        try:
+            return client.insert(
+                table,
+                self.make_blocks(frame, columns, dtypes),
+            )
+        except NativeWriteError as err:
+            self.logs.error(err)
+            raise err
+        except Exception as err:
+            self.logs.error(err)
+            raise NativeWriteError(err)
+
+    def insert_shard(
+        self: "NativeTransfer",
+        shard: Union[PdFrame, PlFrame],
+        client: HttpInsert,
+        table: str,
+        columns: List[str],
+        dtypes: List[str],
+        retries: int,
+        shard_num: int,
+        token: str,
+    ) -> ShardResult:
+        """Insert one shard, encode and send it again on failure
+        with the same deduplication token."""
+
+        settings = {"insert_deduplication_token": f"{token}-{shard_num}"}
+
+        for attempt in range(1, retries + 2):
+            start = perf_counter()
+            blocks = BlockCounter(self.make_blocks(shard, columns, dtypes))
+
+            try:
+                client.insert(table, blocks, settings)
+            except Exception as err:
                 self.logs.warning(
-                    "Get column names from DataFrame operation success."
+                    f"Shard {shard_num} attempt {attempt} failed: {err}"
                 )
-            self.logs.info(f"Columns for write: {columns}")
 
-            if not dtypes:
-                self.logs.warning(
-                    "No data types found. Get data types "
-                    "from DataFrame operation started."
+                if attempt > retries or not retryable(err):
+                    raise NativeWriteError(err)
+
+                sleep(RETRY_DELAY * attempt)
+                continue
+
+            return ShardResult(
+                shard_num,
+                len(shard),
+                blocks.size,
+                perf_counter() - start,
+                attempt,
+            )
+
+    def insert_parallel(
+        self: "NativeTransfer",
+        frame: Union[PdFrame, PlFrame, Iterable[Union[PdFrame, PlFrame]]],
+        client: HttpInsert,
+        table: str,
+        shards: int = 4,
+        retries: int = 2,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[List[str]] = None,
+    ) -> InsertReport:
+        """Split DataFrame into shards of whole Native blocks
+        or take shards from iterator of DataFrames, encode and insert
+        up to shards of them at once."""
+
+        start = perf_counter()
+
+        is_stream = not isinstance(frame, Union[PdFrame, PlFrame])
+        is_inferred = not dtypes
+
+        if not is_stream:
+            first = frame
+            parts = shard_frame(frame, shards, self.block_rows)
+        else:
+            parts = iter(frame)
+            first = next(parts, None)
+
+            if first is None:
+                return InsertReport.from_results([], 0.0)
+
+            parts = chain((first,), parts)
+
+        columns = columns or list(first.columns)
+
+        if is_inferred:
+            dtypes = dtype_from_frame(
+                first, self.sample_rows, self.sample_strategy
+            )
+
+            if is_stream:
+                dtypes = [stream_dtype(dtype) for dtype in dtypes]
+
+        blocks = [compile_dtype(raw_string) for raw_string in dtypes]
+        executor = ThreadPoolExecutor(
+            max_workers=shards,
+            thread_name_prefix="NativeTransfer",
+        )
+        pending: Deque[Future] = deque()
+        results: List[ShardResult] = []
+        token = uuid4().hex
+
+        try:
+            for shard_num, shard in enumerate(parts):
+                if is_stream and is_inferred:
+                    self.check_nulls(shard, blocks, dtypes)
+
+                while len(pending) >= shards:
+                    results.append(pending.popleft().result())
+
+                pending.append(
+                    executor.submit(
+                        self.insert_shard,
+                        shard,
+                        client,
+                        table,
+                        columns,
+                        dtypes,
+                        retries,
+                        shard_num,
+                        token,
+                    )
                 )
-                dtypes: List[str] = dtype_from_frame(frame)
-                self.logs.warning(
-                    "Get data types from DataFrame operation success."
+
+            while pending:
+                results.append(pending.popleft().result())
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        report = InsertReport.from_results(results, perf_counter() - start)
+        self.logs.info(f"Insert into {table} success.\n{report}")
+
+        return report
+
+    async def aiter_blocks(
+        self: "NativeTransfer",
+        reader: Any,
+        frame_type: FrameType = FrameType.Pandas,
+    ) -> AsyncGenerator[Union[PdFrame, PlFrame], None]:
+        """Read Native Format blocks from asyncio.StreamReader-like object,
+        columns are decoded in the executor as bytes arrive.
+        Gzip, zstd, LZ4 frame and compressed Native streams are detected
+        like in open and check_compress."""
+
+        loop = get_running_loop()
+        file = ForwardCursor.from_file(AsyncReader(reader, loop))
+        # magic bytes and the first block are waited for in the executor
+        file = await loop.run_in_executor(None, self.open, file)
+        file = await loop.run_in_executor(None, self.check_compress, file)
+
+        while await loop.run_in_executor(None, file.peek, 1):
+            try:
+                frame = await loop.run_in_executor(
+                    None,
+                    self.extract_block,
+                    file,
+                    frame_type,
                 )
-            self.logs.info(f"Data Types for write: {dtypes}")
+            except EOF as err:
+                msg = f"Native stream ended inside a block: {err}"
+                self.logs.error(msg)
+                raise NativeReadError(msg)
 
-            block_rows: int = self.block_rows
+            yield frame
 
-            for df in chunk_frame(frame, block_rows):
-                total_rows: int = len(df)
-                write_lens(len(columns), buffer)
-                write_lens(total_rows, buffer)
+    async def amake(
+        self: "NativeTransfer",
+        frame: Union[PdFrame, PlFrame],
+        writer: Any,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[List[str]] = None,
+    ) -> None:
+        """Make Native Format into asyncio.StreamWriter-like object,
+        blocks are encoded in the executor and sent as they are ready."""
+
+        loop = get_running_loop()
+        file = BufferedWriter(AsyncWriter(writer, loop), READ_SIZE)
+
+        await loop.run_in_executor(
+            None,
+            self.make,
+            frame,
+            file,
+            columns,
+            dtypes,
+        )
+        await loop.run_in_executor(None, file.flush)
 
-                for idx, column in enumerate(df.columns):
-                    raw_string: str = dtypes[idx]
-                    write_string(columns[idx], buffer)
-                    write_string(raw_string, buffer)
-                    block: Union[Array, DType, LowCardinality] = get_dtype(
-                        raw_string, total_rows
-                    )
-                    block.write(df[column].to_list(), buffer)
-                    del block
+    def make_stream(
+        self: "NativeTransfer",
+        batches: Union[LazyFrame, Iterable[Any]],
+        file: Union[BufferedIOBase, GzipFile],
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[List[str]] = None,
+    ) -> None:
+        """Make Native Format from iterable of polars/pandas DataFrames,
+        polars.LazyFrame or pyarrow.RecordBatchReader batch by batch."""
 
-                file.write(buffer.getvalue())
-                buffer = BytesIO()
-                del df
-            self.logs.info(
-                f"Create native file {file.name} from DataFrame success."
-            )
-        except Exception as err:
-            self.logs.error(err)
-            raise NativeWriteError(err)
+        self.make(frame_batches(batches), file, columns, dtypes)
 
     @staticmethod
     def open(
@@ -317,35 +772,65 @@ class NativeTransfer:
             BufferedIOBase,
             BufferedWriter,
             GzipFile,
+            StreamReader,
         ],
         mode: str = "rb",
-        write_compressed: bool = False,
-    ) -> Union[BufferedIOBase, GzipFile]:
+        write_compressed: Union[bool, StreamMethod] = False,
+        compress_level: Optional[int] = None,
+        workers: int = 1,
+        gzip_index: Union[bool, GzipIndex] = False,
+    ) -> Union[BufferedIOBase, GzipFile, StreamReader, StreamWriter]:
         """Open file for read/write."""
 
-        if isinstance(file, GzipFile):
+        if isinstance(file, Union[GzipFile, StreamReader]):
             file.seek(0)
             return file
         elif isinstance(file, Union[str, PathLike]):
             file = open(file, mode)
         elif isinstance(file, bytes):
-            file = BytesIO(bytes)
+            file = BytesIO(file)
+        elif isinstance(file, ForwardCursor):
+            pass
         elif isinstance(
             file, Union[BufferedIOBase, BufferedReader, BufferedWriter]
         ):
-            file.seek(0)
+            if file.seekable():
+                file.seek(0)
         else:
             raise NativeError("Unsupported file type.")
 
         if mode == "rb":
-            magic: bytes = file.read(2)
-            file.seek(0)
+            if not file.seekable():
+                file = ForwardCursor.from_file(file)
+
+            if isinstance(file, ForwardCursor):
+                magic: bytes = file.lookahead(4)
+            else:
+                magic: bytes = file.read(4)
+                file.seek(0)
+
+            method: Optional[StreamMethod] = detect_stream(magic)
+
+            if method == StreamMethod.GZIP and gzip_index is True:
+                gzip_index = sidecar_index(file)
 
-            if magic == b"\x1f\x8b":
-                return GzipFile(mode=mode, fileobj=file)
+            if method:
+                return StreamReader(
+                    file,
+                    method,
+                    index=gzip_index or None,
+                )
         elif mode == "wb":
             if write_compressed:
-                return GzipFile(mode=mode, fileobj=file)
+                if write_compressed is True:
+                    write_compressed = StreamMethod.GZIP
+
+                return StreamWriter(
+                    file,
+                    write_compressed,
+                    compress_level,
+                    workers,
+                )
 
         return file
 
@@ -369,12 +854,19 @@ class NativeTransfer:
 
         data_value: Optional[int] = FORMAT_VALUES.get(base_file.__class__)
 
+        if isinstance(base_file, StreamReader):
+            data_value = STREAM_VALUES[base_file.method]
+        elif isinstance(base_file, ForwardCursor) and base_file is not file:
+            data_value = FORMAT_VALUES[NativeCompressFile]
+
         if data_value is None:
             raise NativeError("Unsupported Data Format.")
 
         if data_value in (2, 3):
             columns: List[str] = list(base_file.columns)
-            dtypes: List[str] = dtype_from_frame(base_file)
+            dtypes: List[str] = dtype_from_frame(
+                base_file, self.sample_rows, self.sample_strategy
+            )
             total_rows: int = len(base_file)
 
             return get_info(data_value, columns, dtypes, total_rows)
@@ -398,8 +890,8 @@ class NativeTransfer:
                         columns.append(name)
                         dtypes.append(raw_string)
 
-                    block: Union[Array, DType, LowCardinality] = get_dtype(
-                        raw_string, _total_rows
+                    block: Union[Array, DType, LowCardinality] = (
+                        compile_dtype(raw_string)
                     )
                     block.skip(base_file, _total_rows)
 
@@ -415,6 +907,7 @@ Compressed info:
 {base_file.file_blocks}
 """
 
-        base_file.seek(0)
+        if not forward_only(base_file):
+            base_file.seek(0)
 
         return get_info(data_value, columns, dtypes, total_rows)
@@ -0,0 +1,94 @@
+from asyncio import (
+    AbstractEventLoop,
+    run_coroutine_threadsafe,
+)
+from inspect import isawaitable
+from io import RawIOBase
+from typing import Any
+
+
+class AsyncReader(RawIOBase):
+    """Blocking file over asyncio.StreamReader-like object,
+    read from a thread of the executor."""
+
+    def __init__(
+        self,
+        reader: Any,
+        loop: AbstractEventLoop,
+    ) -> None:
+        """Class initialization."""
+
+        self.reader = reader
+        self.loop = loop
+
+    @property
+    def name(self) -> str:
+        """Name of the stream."""
+
+        return getattr(self.reader, "name", self.reader.__class__.__name__)
+
+    def readable(self) -> bool:
+        """Check readable."""
+
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:
+        """Wait in the event loop for the next bytes of the stream."""
+
+        data = run_coroutine_threadsafe(
+            self.reader.read(len(buffer)),
+            self.loop,
+        ).result()
+        buffer[:len(data)] = data
+
+        return len(data)
+
+
+async def write_async(writer: Any, data: bytes) -> None:
+    """Write bytes and wait until the stream takes them."""
+
+    result = writer.write(data)
+
+    if isawaitable(result):
+        await result
+
+    drain = getattr(writer, "drain", None)
+
+    if drain:
+        await drain()
+
+
+class AsyncWriter(RawIOBase):
+    """Blocking file over asyncio.StreamWriter-like object,
+    written from a thread of the executor."""
+
+    def __init__(
+        self,
+        writer: Any,
+        loop: AbstractEventLoop,
+    ) -> None:
+        """Class initialization."""
+
+        self.writer = writer
+        self.loop = loop
+
+    @property
+    def name(self) -> str:
+        """Name of the stream."""
+
+        return getattr(self.writer, "name", self.writer.__class__.__name__)
+
+    def writable(self) -> bool:
+        """Check writable."""
+
+        return True
+
+    def write(self, buffer: memoryview) -> int:
+        """Pass bytes to the event loop, waits for drain."""
+
+        run_coroutine_threadsafe(
+            write_async(self.writer, bytes(buffer)),
+            self.loop,
+        ).result()
+
+        return len(buffer)
@@ -1,11 +1,16 @@
 from typing import (
+    Any,
     Dict,
     Generator,
+    Iterable,
     Union,
 )
 
 from pandas import DataFrame as PdFrame
-from polars import DataFrame as PlFrame
+from polars import (
+    DataFrame as PlFrame,
+    LazyFrame,
+)
 
 from .errors import dtype_error
 
@@ -52,3 +57,42 @@ def chunk_frame(
     """Split DataFrame into blocks."""
 
     return FRAME_CHUNKS.get(frame.__class__, dtype_error)(frame, block_rows)
+
+
+def shard_frame(
+    frame: Union[PdFrame, PlFrame], shards: int, block_rows: int
+) -> Generator[
+    Union[PdFrame, PlFrame],
+    None,
+    None,
+]:
+    """Split DataFrame into shards of whole blocks."""
+
+    total_blocks = -(-len(frame) // block_rows)
+    shard_rows = max(-(-total_blocks // shards), 1) * block_rows
+
+    return chunk_frame(frame, shard_rows)
+
+
+def frame_batches(
+    batches: Union[LazyFrame, Iterable[Any]],
+) -> Generator[
+    Union[PdFrame, PlFrame],
+    None,
+    None,
+]:
+    """DataFrames from iterable of pandas/polars DataFrames,
+    polars.LazyFrame or Arrow record batches."""
+
+    if isinstance(batches, LazyFrame):
+        batches = batches.collect_batches()
+
+    for batch in batches:
+        if isinstance(batch, Union[PdFrame, PlFrame]):
+            yield batch
+        elif hasattr(batch, "__arrow_c_array__") or hasattr(
+            batch, "__arrow_c_stream__"
+        ):
+            yield PlFrame(batch)
+        else:
+            dtype_error(batch)
@@ -1,24 +1,42 @@
 """Library for working with Clickhouse Native format with compression."""
 
-from .codec import CompressCodec
-from .enums import CompressionMethod
+from .codec import (
+    BLOCK_SIZE,
+    CompressCodec,
+)
+from .enums import (
+    ChecksumPolicy,
+    CompressionMethod,
+)
 from .errors import (
     NativeCompressError,
     NativeCompressMethodNotSupport,
     NativeCompressFileError,
     NativeCompressFormatNotSupport,
     NativeCompressExtractError,
+    NativeCompressHashError,
     NativeCompressPackError,
 )
-from .file import NativeCompressFile
+from .file import (
+    CACHE_BLOCKS,
+    NativeCompressFile,
+    decompress_blocks,
+    recompress,
+)
 from .structs import (
+    BlockHeader,
     BlockStruct,
     FileBlocks,
+    block_length,
 )
 
 
 __all__ = (
+    "BLOCK_SIZE",
+    "CACHE_BLOCKS",
+    "BlockHeader",
     "BlockStruct",
+    "ChecksumPolicy",
     "CompressCodec",
     "CompressionMethod",
     "FileBlocks",
@@ -27,6 +45,10 @@ __all__ = (
     "NativeCompressFile",
     "NativeCompressFileError",
     "NativeCompressFormatNotSupport",
+    "NativeCompressHashError",
     "NativeCompressMethodNotSupport",
     "NativeCompressPackError",
+    "block_length",
+    "decompress_blocks",
+    "recompress",
 )
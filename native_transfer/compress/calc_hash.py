@@ -1,11 +1,12 @@
-from struct import pack
+from struct import pack_into
+from typing import Union
 
 from clickhouse_cityhash.cityhash import CityHash128
 
 from .enums import CompressionMethod
 
 
-def calc_hash(block: str|bytes) -> bytes:
+def calc_hash(block: Union[bytes, bytearray, memoryview]) -> bytes:
     """Calculate CityHash128 for bytes."""
 
     city_hash: int = CityHash128(block)
@@ -21,15 +22,19 @@ def block_hash(
     compression_codek: CompressionMethod,
     compressed_size: int,
     block_size: int,
-    block_data: bytes,
+    block_data: Union[bytes, memoryview],
 ) -> bytes:
     """Calculate CityHash128 for a block."""
 
-    return calc_hash(
-        pack(
-            "<B2L",
-            compression_codek.value,
-            compressed_size,
-            block_size
-        ) + block_data
+    buffer = bytearray(9 + len(block_data))
+    pack_into(
+        "<B2L",
+        buffer,
+        0,
+        compression_codek.value,
+        compressed_size,
+        block_size,
     )
+    buffer[9:] = block_data
+
+    return calc_hash(buffer)
@@ -1,8 +1,42 @@
-from typing import Optional
+from os import PathLike
+from struct import unpack_from
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from zstandard import (
+    ZstdCompressionDict,
+    train_dictionary,
+)
 
-from .calc_hash import calc_hash
+from .calc_hash import block_hash
+from .delta_func import (
+    delta_compress,
+    delta_decompress,
+)
+from .double_delta_func import (
+    double_delta_compress,
+    double_delta_decompress,
+)
 from .enums import CompressionMethod
-from .errors import unsupported_method
+from .errors import (
+    NativeCompressExtractError,
+    NativeCompressPackError,
+    unsupported_method,
+)
+from .gcd_func import (
+    gcd_compress,
+    gcd_decompress,
+)
+from .gorilla_func import (
+    gorilla_compress,
+    gorilla_decompress,
+)
 from .lz4_func import (
     lz4_compress,
     lz4_decompress,
@@ -15,6 +49,10 @@ from .structs import (
     BlockStruct,
     FileBlocks,
 )
+from .t64_func import (
+    t64_compress,
+    t64_decompress,
+)
 from .zstd_func import (
     zstd_compress,
     zstd_decompress,
@@ -24,6 +62,13 @@ from .zstd_func import (
 # Just so you don't forget about the default
 # block value in the original utility
 BLOCK_SIZE = 1048576
+# Default dictionary size of zstd --train
+DICTIONARY_SIZE = 112640
+# Codecs and their levels for CompressionMethod.Multiple
+CODEC_CHAIN: List[Tuple[CompressionMethod, int]] = [
+    (CompressionMethod.Delta, 8),
+    (CompressionMethod.ZSTD, 1),
+]
 
 
 class CompressCodec:
@@ -33,20 +78,36 @@ class CompressCodec:
         self,
         default_method: CompressionMethod = CompressionMethod.LZ4,
         default_level: int = 0,
+        dictionary: Optional[ZstdCompressionDict] = None,
+        codec_chain: Optional[List[Tuple[CompressionMethod, int]]] = None,
     ) -> None:
         """Initialization of the class."""
 
         self.default_method = default_method
         self.default_level = default_level
+        self.dictionary = dictionary
+        self.codec_chain = codec_chain or CODEC_CHAIN
         self.compress_selector = {
             CompressionMethod.NONE: none_compress,
             CompressionMethod.LZ4: lz4_compress,
             CompressionMethod.ZSTD: zstd_compress,
+            CompressionMethod.Multiple: self.multiple_compress,
+            CompressionMethod.Delta: delta_compress,
+            CompressionMethod.T64: t64_compress,
+            CompressionMethod.DoubleDelta: double_delta_compress,
+            CompressionMethod.Gorilla: gorilla_compress,
+            CompressionMethod.GCD: gcd_compress,
         }
         self.decompress_selector = {
             CompressionMethod.NONE: none_decompress,
             CompressionMethod.LZ4: lz4_decompress,
             CompressionMethod.ZSTD: zstd_decompress,
+            CompressionMethod.Multiple: self.multiple_decompress,
+            CompressionMethod.Delta: delta_decompress,
+            CompressionMethod.T64: t64_decompress,
+            CompressionMethod.DoubleDelta: double_delta_decompress,
+            CompressionMethod.Gorilla: gorilla_decompress,
+            CompressionMethod.GCD: gcd_decompress,
         }
 
     def compress_block(
@@ -65,6 +126,7 @@ class CompressCodec:
         )(
             block_data=block_data,
             compression_level=compression_level,
+            dictionary=self.dictionary,
         )
 
     def decompress_block(
@@ -78,15 +140,114 @@ class CompressCodec:
             unsupported_method,
         )(
             block=block,
+            dictionary=self.dictionary,
+        )
+
+    def multiple_compress(
+        self,
+        block_data: bytes,
+        **_: dict[str, Any],
+    ) -> BlockStruct:
+        """Pack the block with each codec of codec_chain in turn."""
+
+        methods = bytearray((len(self.codec_chain),))
+        data = block_data
+
+        for method, level in self.codec_chain:
+            if method == CompressionMethod.Multiple:
+                msg = "Multiple can't be nested"
+                raise NativeCompressPackError(msg)
+
+            block = self.compress_selector.get(
+                method,
+                unsupported_method,
+            )(
+                block_data=data,
+                compression_level=level,
+                dictionary=self.dictionary,
+            )
+            methods.append(block.compression_codek.value)
+            data = block.to_bytes()[16:]
+
+        return BlockStruct.from_data(
+            CompressionMethod.Multiple,
+            len(block_data),
+            bytes(methods) + data,
+        )
+
+    def multiple_decompress(
+        self,
+        block: BlockStruct,
+        **_: dict[str, Any],
+    ) -> bytes:
+        """Unpack the block with codecs in reverse order."""
+
+        data = memoryview(block.compressed_data)
+        methods = bytes(data[1:1 + data[0]])
+        data = data[1 + len(methods):]
+
+        for method in reversed(methods):
+            codek, compressed_size, block_size = unpack_from("<B2L", data)
+
+            if codek != method or len(data) < compressed_size:
+                msg = "Corrupted Multiple block"
+                raise NativeCompressExtractError(msg)
+
+            data = self.decompress_block(
+                BlockStruct(
+                    b"",
+                    CompressionMethod(codek),
+                    compressed_size,
+                    block_size,
+                    data[9:compressed_size],
+                    None,
+                )
+            )
+
+        return bytes(data)
+
+    def train_dictionary(
+        self,
+        samples: Iterable[bytes],
+        dict_size: int = DICTIONARY_SIZE,
+    ) -> ZstdCompressionDict:
+        """Train ZSTD dictionary on sample Native blocks."""
+
+        self.dictionary = train_dictionary(
+            dict_size,
+            [bytes(sample) for sample in samples],
+            level=self.default_level,
         )
 
+        return self.dictionary
+
+    def load_dictionary(
+        self,
+        path: Union[str, PathLike],
+    ) -> ZstdCompressionDict:
+        """Load ZSTD dictionary from a file."""
+
+        with open(path, "rb") as file:
+            self.dictionary = ZstdCompressionDict(file.read())
+
+        return self.dictionary
+
+    def save_dictionary(
+        self,
+        path: Union[str, PathLike],
+    ) -> None:
+        """Save ZSTD dictionary to a file."""
+
+        with open(path, "wb") as file:
+            file.write(self.dictionary.as_bytes())
+
     def change_compress_type(
         self,
         block: BlockStruct,
         method: Optional[CompressionMethod] = None,
         level: Optional[int] = None,
     ) -> BlockStruct:
-        """Change the compression method to NONE, LZ4, LZ4HC or ZSTD."""
+        """Change the compression method to NONE, LZ4 or ZSTD."""
 
         return self.compress_block(
             block_data=self.decompress_block(block),
@@ -104,7 +265,12 @@ class CompressCodec:
             return block
 
         return BlockStruct(
-            calc_hash(block.to_bytes()[16:]),
+            block_hash(
+                block.compression_codek,
+                block.compressed_size,
+                block.block_size,
+                block.compressed_data,
+            ),
             *block[1:-1],
             True,
         )
@@ -115,9 +281,8 @@ class CompressCodec:
     ) -> FileBlocks:
         """Recalculate the checksum of all blocks."""
 
-        return FileBlocks(
-            *file[:-1],
-            [
+        return file._replace(
+            block_list=[
                 self.block_hash_repair(block)
                 for block in file.block_list
             ],
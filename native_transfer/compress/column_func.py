@@ -0,0 +1,167 @@
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from numpy import (
+    arange,
+    concatenate,
+    cumsum,
+    dtype,
+    float64,
+    frexp,
+    frombuffer,
+    int64,
+    ndarray,
+    packbits,
+    repeat,
+    uint8,
+    uint32,
+    uint64,
+    where,
+    zeros,
+)
+
+from .errors import (
+    NativeCompressExtractError,
+    NativeCompressPackError,
+)
+
+
+# Width of values for Delta, DoubleDelta, Gorilla and GCD codecs
+DEFAULT_WIDTH = 8
+WIDTH_DTYPES: Dict[int, dtype] = {
+    1: dtype("<u1"),
+    2: dtype("<u2"),
+    4: dtype("<u4"),
+    8: dtype("<u8"),
+}
+
+
+def width_dtype(width: int) -> dtype:
+    """Unsigned numpy dtype of the codec values."""
+
+    if width not in WIDTH_DTYPES:
+        msg = f"Unsupported codec width {width}"
+        raise NativeCompressPackError(msg)
+
+    return WIDTH_DTYPES[width]
+
+
+def split_values(
+    block_data: bytes,
+    width: int,
+) -> Tuple[bytes, ndarray]:
+    """Split data into leading bytes and codec values."""
+
+    bytes_to_skip = len(block_data) % width
+
+    return (
+        bytes(block_data[:bytes_to_skip]),
+        frombuffer(block_data, width_dtype(width), offset=bytes_to_skip),
+    )
+
+
+def split_payload(
+    compressed_data: bytes,
+    block_size: int,
+) -> Tuple[int, bytes, memoryview]:
+    """Split codec payload into width, leading bytes and values."""
+
+    view = memoryview(compressed_data)
+
+    if len(view) < 2 or view[0] not in WIDTH_DTYPES:
+        msg = "Corrupted codec header"
+        raise NativeCompressExtractError(msg)
+
+    width = view[0]
+    bytes_to_skip = block_size % width
+
+    return width, bytes(view[2:2 + bytes_to_skip]), view[2 + bytes_to_skip:]
+
+
+def leading_zeros(values: ndarray, bits: int) -> ndarray:
+    """Number of leading zero bits of non-zero values."""
+
+    smeared = values.astype(uint64)
+
+    for shift in (1, 2, 4, 8, 16, 32):
+        smeared |= smeared >> uint64(shift)
+
+    highest = smeared ^ (smeared >> uint64(1))
+
+    return bits - frexp(highest.astype(float64))[1]
+
+
+def trailing_zeros(values: ndarray) -> ndarray:
+    """Number of trailing zero bits of non-zero values."""
+
+    values = values.astype(uint64)
+    lowest = values & (~values + uint64(1))
+
+    return frexp(lowest.astype(float64))[1] - 1
+
+
+def pack_bits(values: ndarray, lengths: ndarray) -> bytes:
+    """Write values into a bit stream, most significant bit first."""
+
+    lengths = lengths.astype(int64)
+    total = int(lengths.sum())
+
+    if not total:
+        return b""
+
+    starts = cumsum(lengths) - lengths
+    field = repeat(arange(len(lengths)), lengths)
+    shift = lengths[field] - 1 - (arange(total) - starts[field])
+    bits = (values.astype(uint64)[field] >> shift.astype(uint64)) & 1
+
+    return packbits(bits.astype(uint8)).tobytes()
+
+
+def bit_buffer(data: bytes) -> ndarray:
+    """Bit stream with padding for reading by windows."""
+
+    return concatenate((frombuffer(data, uint8), zeros(9, uint8)))
+
+
+def bit_windows(buffer: ndarray) -> List[int]:
+    """Next 32 bits of the bit stream from every byte."""
+
+    windows = zeros(len(buffer) - 3, uint32)
+
+    for byte in range(4):
+        windows |= buffer[byte:len(buffer) - 3 + byte].astype(uint32) << (
+            uint32(24 - byte * 8)
+        )
+
+    return windows.tolist()
+
+
+def read_bits(
+    buffer: ndarray,
+    offsets: ndarray,
+    lengths: ndarray,
+) -> ndarray:
+    """Read up to 64 bits from every offset of the bit stream."""
+
+    offsets = offsets.astype(int64)
+    lengths = lengths.astype(uint64)
+    position = offsets >> 3
+    high = zeros(len(offsets), uint64)
+
+    for byte in range(8):
+        high |= buffer[position + byte].astype(uint64) << uint64(
+            56 - byte * 8
+        )
+
+    shift = (offsets & 7).astype(uint64)
+    low = buffer[position + 8].astype(uint64) >> (uint64(8) - shift)
+    values = (high << shift) | low
+
+    return where(
+        lengths > 0,
+        values >> ((uint64(64) - lengths) % uint64(64)),
+        uint64(0),
+    )
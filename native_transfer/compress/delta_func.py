@@ -0,0 +1,55 @@
+from typing import Any
+
+from numpy import (
+    cumsum,
+    diff,
+    frombuffer,
+)
+
+from .column_func import (
+    DEFAULT_WIDTH,
+    split_payload,
+    split_values,
+    width_dtype,
+)
+from .enums import CompressionMethod
+from .structs import BlockStruct
+
+
+def delta_compress(
+    block_data: bytes,
+    compression_level: int = 0,
+    **_: dict[str, Any],
+) -> BlockStruct:
+    """Pack the block into Delta."""
+
+    width = compression_level or DEFAULT_WIDTH
+    skipped, values = split_values(block_data, width)
+
+    return BlockStruct.from_data(
+        CompressionMethod.Delta,
+        len(block_data),
+        b"".join((
+            bytes((width, len(skipped))),
+            skipped,
+            diff(values, prepend=values.dtype.type(0)).tobytes(),
+        )),
+    )
+
+
+def delta_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
+    """Extract data from Delta block."""
+
+    width, skipped, payload = split_payload(
+        block.compressed_data,
+        block.block_size,
+    )
+    values_dtype = width_dtype(width)
+
+    return skipped + cumsum(
+        frombuffer(payload, values_dtype),
+        dtype=values_dtype,
+    ).tobytes()
@@ -0,0 +1,205 @@
+from struct import (
+    pack,
+    unpack_from,
+)
+from typing import (
+    Any,
+    List,
+    Tuple,
+)
+
+from numpy import (
+    array,
+    column_stack,
+    concatenate,
+    cumsum,
+    diff,
+    frombuffer,
+    int64,
+    uint64,
+    where,
+    zeros,
+)
+
+from .column_func import (
+    DEFAULT_WIDTH,
+    bit_buffer,
+    bit_windows,
+    pack_bits,
+    read_bits,
+    split_payload,
+    split_values,
+    width_dtype,
+)
+from .enums import CompressionMethod
+from .errors import NativeCompressExtractError
+from .structs import BlockStruct
+
+
+# exclusive bounds of double delta, prefix, prefix bits, value bits
+DELTA_SPECS: Tuple[Tuple[int, int, int, int, int], ...] = (
+    (-63, 64, 0b10, 2, 7),
+    (-255, 256, 0b110, 3, 9),
+    (-2047, 2048, 0b1110, 4, 12),
+    (-2 ** 31, 2 ** 31 - 1, 0b11110, 5, 32),
+)
+LONG_SPEC: Tuple[int, int] = (0b11111, 5)
+
+
+def delta_spec(prefix: int) -> Tuple[int, int]:
+    """Read step and value bits for the first 6 bits of the item."""
+
+    if not prefix >> 5:
+        return 1, 0
+
+    ones = 1
+
+    while ones < 5 and prefix >> (5 - ones) & 1:
+        ones += 1
+
+    prefix_bits = min(ones + 1, 5)
+    value_bits = (7, 9, 12, 32, 64)[ones - 1] - 1
+
+    return prefix_bits + 1 + value_bits, value_bits
+
+
+# all variants of the first 6 bits of the item
+DELTA_STEPS: List[Tuple[int, int]] = [
+    delta_spec(prefix)
+    for prefix in range(64)
+]
+
+
+def double_delta_compress(
+    block_data: bytes,
+    compression_level: int = 0,
+    **_: dict[str, Any],
+) -> BlockStruct:
+    """Pack the block into DoubleDelta."""
+
+    width = compression_level or DEFAULT_WIDTH
+    skipped, values = split_values(block_data, width)
+    chunks = [
+        bytes((width, len(skipped))),
+        skipped,
+        pack("<L", len(values)),
+        values[:1].tobytes(),
+        diff(values[:2]).tobytes(),
+    ]
+
+    if len(values) > 2:
+        deltas = diff(values)
+        double_deltas = diff(deltas).astype(
+            f"<i{width}",
+            copy=False,
+        ).astype(int64)
+        sign = (double_deltas < 0).astype(uint64)
+        absolute = where(
+            sign,
+            uint64(0) - double_deltas.astype(uint64),
+            double_deltas.astype(uint64),
+        ) - uint64(1)
+        prefix = zeros(len(double_deltas), uint64) + uint64(LONG_SPEC[0])
+        prefix_bits = zeros(len(double_deltas), int64) + LONG_SPEC[1]
+        value_bits = zeros(len(double_deltas), int64) + 64
+
+        for low, high, spec_prefix, spec_bits, spec_value in reversed(
+            DELTA_SPECS
+        ):
+            fits = (double_deltas > low) & (double_deltas < high)
+            prefix[fits] = spec_prefix
+            prefix_bits[fits] = spec_bits
+            value_bits[fits] = spec_value
+
+        is_zero = double_deltas == 0
+        chunks.append(pack_bits(
+            column_stack((
+                where(is_zero, uint64(0), (prefix << uint64(1)) | sign),
+                absolute,
+            )).ravel(),
+            column_stack((
+                where(is_zero, 1, prefix_bits + 1),
+                where(is_zero, 0, value_bits - 1),
+            )).ravel(),
+        ))
+
+    return BlockStruct.from_data(
+        CompressionMethod.DoubleDelta,
+        len(block_data),
+        b"".join(chunks),
+    )
+
+
+def double_delta_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
+    """Extract data from DoubleDelta block."""
+
+    width, skipped, payload = split_payload(
+        block.compressed_data,
+        block.block_size,
+    )
+    values_dtype = width_dtype(width)
+
+    if len(payload) < 4:
+        return skipped
+
+    items_count, *_ = unpack_from("<L", payload)
+    first = cumsum(
+        frombuffer(
+            payload,
+            values_dtype,
+            count=min(items_count, 2),
+            offset=4,
+        ),
+        dtype=values_dtype,
+    )
+
+    if items_count <= 2:
+        return skipped + first.tobytes()
+
+    buffer = bit_buffer(payload[4 + width * 2:])
+    windows = bit_windows(buffer)
+    items: List[int] = []
+    offsets: List[int] = []
+    lengths: List[int] = []
+    position = 0
+
+    for item in range(items_count - 2):
+        step, value_bits = DELTA_STEPS[
+            (windows[position >> 3] << (position & 7)) >> 26 & 63
+        ]
+
+        if value_bits:
+            items.append(item)
+            offsets.append(position + step - value_bits - 1)
+            lengths.append(value_bits)
+
+        position += step
+
+    if position > (len(buffer) - 9) * 8:
+        msg = "Corrupted DoubleDelta data"
+        raise NativeCompressExtractError(msg)
+
+    offsets = array(offsets, int64)
+    sign = read_bits(buffer, offsets, zeros(len(offsets), int64) + 1)
+    absolute = read_bits(buffer, offsets + 1, array(lengths)) + uint64(1)
+    double_deltas = zeros(items_count - 2, uint64)
+    double_deltas[array(items, int64)] = where(
+        sign,
+        uint64(0) - absolute,
+        absolute,
+    )
+    deltas = cumsum(
+        concatenate((
+            first[1:] - first[:1],
+            double_deltas.astype(values_dtype),
+        )),
+        dtype=values_dtype,
+    )
+
+    return skipped + cumsum(
+        concatenate((first[:1], deltas)),
+        dtype=values_dtype,
+    ).tobytes()
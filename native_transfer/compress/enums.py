@@ -19,3 +19,11 @@ class CompressionMethod(Enum):
     GCD = 0x9a
     ZSTD_QPL = 0x9b
     SZ3 = 0x9c
+
+
+class ChecksumPolicy(Enum):
+    """Verification of compressed block checksums."""
+
+    Verify = "verify"
+    Lazy = "lazy"
+    Skip = "skip"
@@ -24,6 +24,10 @@ class NativeCompressExtractError(NativeCompressError):
     """Error retrieving data."""
 
 
+class NativeCompressHashError(NativeCompressExtractError):
+    """Block checksum mismatch."""
+
+
 class NativeCompressPackError(NativeCompressError):
     """Error during compression."""
 
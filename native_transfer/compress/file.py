@@ -1,3 +1,12 @@
+from bisect import bisect_right
+from collections import (
+    OrderedDict,
+    deque,
+)
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from gzip import GzipFile
 from io import (
     BufferedIOBase,
@@ -5,14 +14,43 @@ from io import (
     BufferedWriter,
     BytesIO,
 )
-from logging import Logger
+from itertools import accumulate
+from logging import (
+    Logger,
+    getLogger,
+)
 from typing import (
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
     Optional,
+    Tuple,
     Union,
 )
 
-from .codec import CompressCodec
-from .structs import FileBlocks
+from .codec import (
+    BLOCK_SIZE,
+    CompressCodec,
+)
+from .calc_hash import calc_hash
+from .enums import (
+    ChecksumPolicy,
+    CompressionMethod,
+)
+from .errors import (
+    NativeCompressError,
+    NativeCompressHashError,
+)
+from .structs import (
+    HEADER,
+    BlockStruct,
+    FileBlocks,
+)
+
+
+CACHE_BLOCKS = 4
 
 
 class NativeCompressFile:
@@ -29,21 +67,47 @@ class NativeCompressFile:
         ],
         codec: CompressCodec,
         logs: Logger,
+        frame_size: int = BLOCK_SIZE,
+        workers: int = 1,
+        max_pending: int = 0,
+        checksum_policy: ChecksumPolicy = ChecksumPolicy.Verify,
+        cache_blocks: int = CACHE_BLOCKS,
     ) -> None:
         """Initializing a class."""
 
         self.file = file
         self.codec = codec
         self.logs = logs
-        self.buffer = BytesIO()
-        self.file_blocks: FileBlocks = FileBlocks.from_file(file)
-        [
-            self.buffer.write(
-                self.codec.decompress_block(block)
+        self.frame_size = frame_size
+        self.write_buffer = bytearray()
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.pending: Deque[Future] = deque()
+        self.ahead: Dict[int, Future] = {}
+        self.checksum_policy = checksum_policy
+        self.checks: Dict[int, Future] = {}
+        self.cache_blocks = cache_blocks
+        self.cache: OrderedDict[int, bytes] = OrderedDict()
+
+        if workers > 1 or checksum_policy == ChecksumPolicy.Lazy:
+            self.executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="NativeCompressFile",
             )
-            for block in self.file_blocks.block_list
-        ]
-        self.buffer.seek(0)
+
+        self.file_blocks: FileBlocks = FileBlocks.from_headers(
+            file,
+            checksum_policy,
+        )
+        self.offsets: List[int] = list(
+            accumulate(
+                (block.block_size for block in self.file_blocks.block_list),
+                initial=0,
+            )
+        )
+        self.block_num = -1
+        self.buffer = BytesIO()
         self.logs.info(self.file_blocks)
 
     def __enter__(self) -> "NativeCompressFile":
@@ -65,12 +129,160 @@ class NativeCompressFile:
 
         return self.file.name
 
+    def read_raw(self, block_num: int) -> bytes:
+        """Read compressed block with its header from the file."""
+
+        header = self.file_blocks.block_list[block_num]
+        self.file.seek(header.offset)
+
+        return self.file.read(16 + header.compressed_size)
+
+    def decode_block(
+        self,
+        raw_block: bytes,
+    ) -> Tuple[Optional[bool], bytes]:
+        """Verify and decompress one block."""
+
+        block = BlockStruct.from_buffer(
+            raw_block,
+            self.checksum_policy == ChecksumPolicy.Verify or (
+                self.checksum_policy == ChecksumPolicy.Lazy
+                and self.workers > 1
+            ),
+        )
+
+        return block.is_valid, self.codec.decompress_block(block)
+
+    def check_block(self, raw_block: bytes) -> bool:
+        """Verify the checksum of one block."""
+
+        view = memoryview(raw_block)
+
+        return calc_hash(view[16:]) == view[:16]
+
+    def check_results(self, wait: bool = False) -> None:
+        """Write the results of background checks into the blocks."""
+
+        for block_num, future in list(self.checks.items()):
+            if not wait and not future.done():
+                continue
+
+            del self.checks[block_num]
+            self.set_valid(block_num, future.result())
+
+    def set_valid(self, block_num: int, is_valid: Optional[bool]) -> None:
+        """Save checksum status of the block."""
+
+        header = self.file_blocks.block_list[block_num]
+        self.file_blocks.block_list[block_num] = header._replace(
+            is_valid=is_valid,
+        )
+
+        if is_valid is not False:
+            return
+
+        msg = f"Checksum mismatch in block {block_num}"
+
+        if self.checksum_policy == ChecksumPolicy.Verify:
+            raise NativeCompressHashError(msg)
+
+        self.logs.warning(msg)
+
+    def read_ahead(self, block_num: int) -> Future:
+        """Decompress the block and the next max_pending blocks
+        in the thread pool."""
+
+        future = self.ahead.pop(block_num, None) or self.executor.submit(
+            self.decode_block,
+            self.read_raw(block_num),
+        )
+        last_num = min(
+            block_num + self.max_pending,
+            self.file_blocks.total_blocks - 1,
+        )
+
+        for num in list(self.ahead):
+            if not block_num < num <= last_num:
+                self.ahead.pop(num).cancel()
+
+        for num in range(block_num + 1, last_num + 1):
+            if num not in self.ahead:
+                self.ahead[num] = self.executor.submit(
+                    self.decode_block,
+                    self.read_raw(num),
+                )
+
+        return future
+
+    def block_index(self, position: int) -> int:
+        """Number of the block holding the uncompressed position."""
+
+        return min(
+            bisect_right(self.offsets, position),
+            self.file_blocks.total_blocks,
+        ) - 1
+
+    def cache_block(self, block_num: int, block_data: bytes) -> None:
+        """Keep decompressed block, drop the least recently used."""
+
+        if self.cache_blocks < 1:
+            return
+
+        self.cache[block_num] = block_data
+
+        while len(self.cache) > self.cache_blocks:
+            self.cache.popitem(last=False)
+
+    def load_block(self, block_num: int) -> None:
+        """Read and decompress one block or take it from the cache."""
+
+        if block_num in self.cache:
+            self.cache.move_to_end(block_num)
+            self.buffer = BytesIO(self.cache[block_num])
+            self.block_num = block_num
+            return
+
+        raw_block = None
+
+        # read ahead workers already verify the raw blocks they hold
+        if self.checksum_policy == ChecksumPolicy.Lazy and self.workers < 2:
+            raw_block = self.read_raw(block_num)
+            self.checks[block_num] = self.executor.submit(
+                self.check_block,
+                raw_block,
+            )
+            self.check_results()
+
+        if self.workers > 1:
+            is_valid, block_data = self.read_ahead(block_num).result()
+        else:
+            is_valid, block_data = self.decode_block(
+                raw_block or self.read_raw(block_num)
+            )
+
+        if is_valid is not None:
+            self.set_valid(block_num, is_valid)
+
+        self.cache_block(block_num, block_data)
+        self.buffer = BytesIO(block_data)
+        self.block_num = block_num
+
+    def shutdown(self) -> None:
+        """Write pending frames and stop the thread pool."""
+
+        self.flush()
+
+        if self.executor:
+            self.check_results(wait=True)
+            self.executor.shutdown(cancel_futures=True)
+
     def close(self) -> None:
         """Close func."""
 
-        self.flush()
+        self.shutdown()
         self.file.close()
         self.buffer.close()
+        self.cache.clear()
         del self.file_blocks, self.buffer
 
     def fileno(self) -> Optional[int]:
@@ -82,6 +294,13 @@ class NativeCompressFile:
     def flush(self) -> None:
         """Flush func."""
 
+        if self.write_buffer:
+            self.write_block(bytes(self.write_buffer))
+            self.write_buffer.clear()
+
+        while self.pending:
+            self.write_pending()
+
         self.file.flush()
 
     def readable(self) -> bool:
@@ -102,7 +321,10 @@ class NativeCompressFile:
     def tell(self) -> int:
         """Tell func."""
 
-        return self.buffer.tell()
+        if self.block_num < 0:
+            return self.buffer.tell()
+
+        return self.offsets[self.block_num] + self.buffer.tell()
 
     def seek(
         self,
@@ -111,10 +333,22 @@ class NativeCompressFile:
     ) -> int:
         """Seek func."""
 
-        return self.buffer.seek(
-            position,
-            stop,
-        )
+        if stop == 1:
+            position += self.tell()
+        elif stop == 2:
+            position += self.file_blocks.full_size
+
+        block_num = self.block_index(position)
+
+        if block_num < 0:
+            return self.buffer.seek(position)
+
+        if block_num != self.block_num:
+            self.load_block(block_num)
+
+        self.buffer.seek(position - self.offsets[block_num])
+
+        return self.tell()
 
     def read(
         self,
@@ -122,7 +356,56 @@ class NativeCompressFile:
     ) -> bytes:
         """Read func."""
 
-        return self.buffer.read(lenghts)
+        if lenghts is None:
+            lenghts = -1
+
+        data = self.buffer.read(lenghts)
+
+        if len(data) == lenghts:
+            return data
+
+        chunks = [data]
+
+        if lenghts > 0:
+            lenghts -= len(data)
+
+        while lenghts and self.block_num + 1 < self.file_blocks.total_blocks:
+            self.load_block(self.block_num + 1)
+            data = self.buffer.read(lenghts)
+            chunks.append(data)
+
+            if lenghts > 0:
+                lenghts -= len(data)
+
+        return b"".join(chunks)
+
+    def write_block(
+        self,
+        block_data: bytes,
+    ) -> None:
+        """Compress one frame into the file."""
+
+        if not self.executor:
+            self.write_compressed(self.codec.compress_block(block_data))
+            return
+
+        while len(self.pending) >= self.max_pending:
+            self.write_pending()
+
+        self.pending.append(
+            self.executor.submit(self.codec.compress_block, block_data)
+        )
+
+    def write_pending(self) -> None:
+        """Write the oldest frame compressed in the thread pool."""
+
+        self.write_compressed(self.pending.popleft().result())
+
+    def write_compressed(self, block: BlockStruct) -> None:
+        """Write compressed block into the file."""
+
+        self.file.write(block.header())
+        self.file.write(block.compressed_data)
 
     def write(
         self,
@@ -130,9 +413,116 @@ class NativeCompressFile:
     ) -> int:
         """Write func."""
 
-        self.file.write(
-            self.codec.compress_block(
-                bytes(buffer)
-            ).to_bytes()
-        )
+        self.write_buffer.extend(buffer)
+
+        if len(self.write_buffer) >= self.frame_size:
+            view = memoryview(self.write_buffer)
+            position = 0
+
+            while len(self.write_buffer) - position >= self.frame_size:
+                self.write_block(
+                    bytes(view[position:position + self.frame_size])
+                )
+                position += self.frame_size
+
+            view.release()
+            del self.write_buffer[:position]
+
         return len(buffer)
+
+
+def recompress(
+    src: Union[BufferedIOBase, BufferedReader, BytesIO],
+    dst: Union[BufferedIOBase, BufferedWriter, BytesIO],
+    method: CompressionMethod = CompressionMethod.LZ4,
+    level: int = 0,
+    workers: int = 1,
+    frame_size: Optional[int] = None,
+    codec: Optional[CompressCodec] = None,
+    logs: Logger = getLogger(__name__),
+) -> None:
+    """Re-encode compressed Native file block by block.
+    Keeps source blocks or makes frames of frame_size bytes."""
+
+    codec = codec or CompressCodec()
+    reader = NativeCompressFile(src, codec, logs, workers=workers)
+    writer = NativeCompressFile(
+        dst,
+        CompressCodec(
+            default_method=method,
+            default_level=level,
+            dictionary=codec.dictionary,
+            codec_chain=codec.codec_chain,
+        ),
+        logs,
+        frame_size=frame_size or BLOCK_SIZE,
+        workers=workers,
+    )
+
+    try:
+        if frame_size:
+            while chunk := reader.read(frame_size):
+                writer.write(chunk)
+        else:
+            for header in reader.file_blocks.block_list:
+                writer.write_block(reader.read(header.block_size))
+    finally:
+        reader.shutdown()
+        writer.shutdown()
+
+    logs.info(
+        f"Recompressed {reader.file_blocks.total_blocks} blocks "
+        f"into {method.name}."
+    )
+
+
+def decompress_blocks(
+    chunks: Iterable[bytes],
+    codec: CompressCodec,
+    checksum_policy: ChecksumPolicy = ChecksumPolicy.Verify,
+    logs: Logger = getLogger(__name__),
+) -> Generator[bytes, None, None]:
+    """Decompress blocks of compressed Native stream without seeking,
+    every block is returned as soon as it is complete."""
+
+    buffer = bytearray()
+    block_num = 0
+
+    for chunk in chunks:
+        buffer.extend(chunk)
+        position = 0
+
+        while len(buffer) - position >= HEADER.size:
+            _, _, compressed_size, _ = HEADER.unpack_from(buffer, position)
+
+            if compressed_size < 9:
+                msg = f"Invalid compressed block size {compressed_size}"
+                raise NativeCompressError(msg)
+
+            end = position + 16 + compressed_size
+
+            if len(buffer) < end:
+                break
+
+            block = BlockStruct.from_buffer(
+                buffer[position:end],
+                checksum_policy != ChecksumPolicy.Skip,
+            )
+
+            if block.is_valid is False:
+                msg = f"Checksum mismatch in block {block_num}"
+
+                if checksum_policy == ChecksumPolicy.Verify:
+                    raise NativeCompressHashError(msg)
+
+                logs.warning(msg)
+
+            yield codec.decompress_block(block)
+            block_num += 1
+            position = end
+
+        del buffer[:position]
+
+    if buffer:
+        msg = "Compressed stream ended inside a block"
+        raise NativeCompressError(msg)
@@ -0,0 +1,58 @@
+from typing import Any
+
+from numpy import (
+    frombuffer,
+    gcd,
+)
+
+from .column_func import (
+    DEFAULT_WIDTH,
+    split_payload,
+    split_values,
+    width_dtype,
+)
+from .enums import CompressionMethod
+from .structs import BlockStruct
+
+
+def gcd_compress(
+    block_data: bytes,
+    compression_level: int = 0,
+    **_: dict[str, Any],
+) -> BlockStruct:
+    """Pack the block into GCD."""
+
+    width = compression_level or DEFAULT_WIDTH
+    skipped, values = split_values(block_data, width)
+    divider = gcd.reduce(values) if len(values) else values.dtype.type(0)
+
+    if divider > 1:
+        values = values // divider
+
+    return BlockStruct.from_data(
+        CompressionMethod.GCD,
+        len(block_data),
+        b"".join((
+            bytes((width, len(skipped))),
+            skipped,
+            divider.tobytes(),
+            values.tobytes(),
+        )),
+    )
+
+
+def gcd_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
+    """Extract data from GCD block."""
+
+    width, skipped, payload = split_payload(
+        block.compressed_data,
+        block.block_size,
+    )
+    values_dtype = width_dtype(width)
+    divider = frombuffer(payload, values_dtype, count=1)[0]
+    values = frombuffer(payload, values_dtype, offset=width)
+
+    return skipped + (values * divider).tobytes()
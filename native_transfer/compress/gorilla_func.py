@@ -0,0 +1,195 @@
+from struct import (
+    pack,
+    unpack_from,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from numpy import (
+    array,
+    bitwise_xor,
+    concatenate,
+    frombuffer,
+    int64,
+    uint64,
+    zeros,
+)
+
+from .column_func import (
+    DEFAULT_WIDTH,
+    bit_buffer,
+    bit_windows,
+    leading_zeros,
+    pack_bits,
+    read_bits,
+    split_payload,
+    split_values,
+    trailing_zeros,
+    width_dtype,
+)
+from .enums import CompressionMethod
+from .errors import NativeCompressExtractError
+from .structs import BlockStruct
+
+
+# bits to store the number of meaningful bits of xored value
+DATA_BITS: Dict[int, int] = {
+    1: 4,
+    2: 5,
+    4: 6,
+    8: 7,
+}
+
+
+def gorilla_compress(
+    block_data: bytes,
+    compression_level: int = 0,
+    **_: dict[str, Any],
+) -> BlockStruct:
+    """Pack the block into Gorilla."""
+
+    width = compression_level or DEFAULT_WIDTH
+    skipped, values = split_values(block_data, width)
+    chunks = [
+        bytes((width, len(skipped))),
+        skipped,
+        pack("<L", len(values)),
+        values[:1].tobytes(),
+    ]
+
+    if len(values) > 1:
+        bits = width * 8
+        data_bits = DATA_BITS[width]
+        header_bits = data_bits * 2 + 1
+        xored = (values[1:] ^ values[:-1]).astype(uint64)
+        is_zero = xored == 0
+        leading = zeros(len(xored), int64)
+        trailing = zeros(len(xored), int64)
+        leading[~is_zero] = leading_zeros(xored[~is_zero], bits)
+        trailing[~is_zero] = trailing_zeros(xored[~is_zero])
+        fields: List[int] = []
+        lengths: List[int] = []
+        prev_leading = prev_trailing = prev_bits = 0
+
+        for value, lead, trail in zip(
+            xored.tolist(),
+            leading.tolist(),
+            trailing.tolist(),
+        ):
+            if not value:
+                fields.append(0)
+                lengths.append(1)
+            elif (
+                prev_bits
+                and prev_leading <= lead
+                and prev_trailing <= trail
+            ):
+                fields.extend((0b10, value >> prev_trailing))
+                lengths.extend((2, prev_bits))
+            else:
+                prev_leading = lead
+                prev_trailing = trail
+                prev_bits = bits - lead - trail
+                fields.extend((
+                    (0b11 << (header_bits - 2))
+                    | (lead << data_bits)
+                    | prev_bits,
+                    value >> trail,
+                ))
+                lengths.extend((header_bits, prev_bits))
+
+        chunks.append(pack_bits(
+            array(fields, uint64),
+            array(lengths, int64),
+        ))
+
+    return BlockStruct.from_data(
+        CompressionMethod.Gorilla,
+        len(block_data),
+        b"".join(chunks),
+    )
+
+
+def gorilla_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
+    """Extract data from Gorilla block."""
+
+    width, skipped, payload = split_payload(
+        block.compressed_data,
+        block.block_size,
+    )
+    values_dtype = width_dtype(width)
+
+    if len(payload) < 4:
+        return skipped
+
+    items_count, *_ = unpack_from("<L", payload)
+    first = frombuffer(
+        payload,
+        values_dtype,
+        count=min(items_count, 1),
+        offset=4,
+    )
+
+    if items_count <= 1:
+        return skipped + first.tobytes()
+
+    bits = width * 8
+    data_bits = DATA_BITS[width]
+    header_bits = data_bits * 2 + 1
+    data_mask = (1 << data_bits) - 1
+    buffer = bit_buffer(payload[4 + width:])
+    windows = bit_windows(buffer)
+    items: List[int] = []
+    offsets: List[int] = []
+    lengths: List[int] = []
+    shifts: List[int] = []
+    prev_bits = prev_trailing = 0
+    position = 0
+
+    for item in range(items_count - 1):
+        window = (windows[position >> 3] << (position & 7)) & 0xFFFFFFFF
+
+        if not window >> 31:
+            position += 1
+            continue
+
+        if window >> 30 & 1:
+            header = window >> (32 - header_bits)
+            prev_bits = header & data_mask
+            prev_trailing = bits - (header >> data_bits & data_mask >> 1)
+            prev_trailing -= prev_bits
+            position += header_bits
+        else:
+            position += 2
+
+        if not prev_bits:
+            msg = "Corrupted Gorilla data"
+            raise NativeCompressExtractError(msg)
+
+        items.append(item)
+        offsets.append(position)
+        lengths.append(prev_bits)
+        shifts.append(prev_trailing)
+        position += prev_bits
+
+    if position > (len(buffer) - 9) * 8:
+        msg = "Corrupted Gorilla data"
+        raise NativeCompressExtractError(msg)
+
+    xored = zeros(items_count - 1, uint64)
+    xored[array(items, int64)] = read_bits(
+        buffer,
+        array(offsets, int64),
+        array(lengths, int64),
+    ) << array(shifts, uint64)
+
+    return skipped + bitwise_xor.accumulate(
+        concatenate((first, xored.astype(values_dtype))),
+        dtype=values_dtype,
+    ).tobytes()
@@ -11,14 +11,13 @@ from .enums import CompressionMethod
 from .structs import BlockStruct
 
 
-def lz4_compress(
+def lz4_block(
     block_data: bytes,
-    **_: dict[str, Any],
+    compressed_data: bytes,
 ) -> BlockStruct:
-    """Pack the block into LZ4."""
+    """Make LZ4 block from compressed data."""
 
     block_size = len(block_data)
-    compressed_data = compress(block_data)
     compressed_size = len(compressed_data) + 9
     compression_codek = CompressionMethod.LZ4
     city_hash_128 = block_hash(
@@ -38,7 +37,30 @@ def lz4_compress(
     )
 
 
-def lz4_decompress(block: BlockStruct) -> bytes:
+def lz4_compress(
+    block_data: bytes,
+    compression_level: int = 0,
+    **_: dict[str, Any],
+) -> BlockStruct:
+    """Pack the block into LZ4, LZ4HC for compression_level 1-12."""
+
+    if compression_level > 0:
+        compressed_data = compress(
+            block_data,
+            mode="high_compression",
+            compression=compression_level,
+            store_size=False,
+        )
+    else:
+        compressed_data = compress(block_data, store_size=False)
+
+    return lz4_block(block_data, compressed_data)
+
+
+def lz4_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
     """Extract data from LZ4 block."""
 
     try:
@@ -47,4 +69,5 @@ def lz4_decompress(block: BlockStruct) -> bytes:
             uncompressed_size=block.block_size,
         )
     except LZ4BlockError:
+        # blocks written with the uncompressed size prefix
         return decompress(block.compressed_data)
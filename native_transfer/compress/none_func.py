@@ -31,7 +31,10 @@ def none_compress(
     )
 
 
-def none_decompress(block: BlockStruct) -> bytes:
+def none_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
     """Extract data from a block without compression."""
 
     return block.compressed_data
@@ -6,22 +6,54 @@ from io import (
     BytesIO,
 )
 from struct import (
-    pack,
+    Struct,
     unpack,
 )
 from typing import (
     NamedTuple,
+    Optional,
     Union,
 )
 
-from .calc_hash import calc_hash
-from .enums import CompressionMethod
+from .calc_hash import (
+    block_hash,
+    calc_hash,
+)
+from .enums import (
+    ChecksumPolicy,
+    CompressionMethod,
+)
 from .errors import (
     NativeCompressError,
+    NativeCompressExtractError,
     NativeCompressFileError,
 )
 
 
+# city_hash_128, compression_codek, compressed_size, block_size
+HEADER = Struct("<16sB2L")
+
+
+def block_length(header: bytes) -> int:
+    """Length of compressed block with its checksum by the header,
+    0 if the bytes are not a block header."""
+
+    if len(header) < HEADER.size:
+        return 0
+
+    _, codek, compressed_size, _ = HEADER.unpack_from(header)
+
+    if compressed_size < 9:
+        return 0
+
+    try:
+        CompressionMethod(codek)
+    except ValueError:
+        return 0
+
+    return 16 + compressed_size
+
+
 class BlockStruct(NamedTuple):
     """Compressed block structure."""
 
@@ -29,13 +61,17 @@ class BlockStruct(NamedTuple):
     compression_codek: CompressionMethod
     compressed_size: int
     block_size: int
-    compressed_data: bytes
-    is_valid: bool
+    compressed_data: Union[bytes, memoryview]
+    is_valid: Optional[bool]
 
     def __str__(self) -> str:
         """String representation of the block."""
 
-        hash_status = "Valid" if self.is_valid else "Broken"
+        hash_status = {
+            True: "Valid",
+            False: "Broken",
+            None: "Not checked",
+        }[self.is_valid]
 
         return f"""hash: 0x{self.city_hash_128.hex().upper()}
 hash status: {hash_status}
@@ -43,16 +79,77 @@ codek: {self.compression_codek.name}
 compressed block size: {self.compressed_size} bytes
 decompressed data size: {self.block_size} bytes"""
 
-    def to_bytes(self) -> bytes:
-        """Return block as bytes."""
+    def header(self) -> bytes:
+        """Return block header as bytes."""
 
-        return pack(
-            f"<16sB2L{len(self.compressed_data)}s",
+        return HEADER.pack(
             self.city_hash_128,
             self.compression_codek.value,
             self.compressed_size,
             self.block_size,
-            self.compressed_data,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Return block as bytes."""
+
+        return b"".join((self.header(), self.compressed_data))
+
+    @classmethod
+    def from_data(
+        cls,
+        compression_codek: CompressionMethod,
+        block_size: int,
+        compressed_data: bytes,
+    ) -> "BlockStruct":
+        """Make a block from compressed data."""
+
+        compressed_size = len(compressed_data) + 9
+
+        return cls(
+            block_hash(
+                compression_codek,
+                compressed_size,
+                block_size,
+                compressed_data,
+            ),
+            compression_codek,
+            compressed_size,
+            block_size,
+            compressed_data,
+            True,
+        )
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: Union[bytes, bytearray, memoryview],
+        verify: bool = True,
+    ) -> "BlockStruct":
+        """Extract a block from one buffer without copying the data."""
+
+        view = memoryview(buffer)
+
+        if len(view) < HEADER.size:
+            msg = "EOF"
+            raise NativeCompressError(msg)
+
+        city_hash_128, codek, compressed_size, block_size = (
+            HEADER.unpack_from(view)
+        )
+        is_valid = None
+
+        if verify:
+            is_valid = (
+                calc_hash(view[16:16 + compressed_size]) == city_hash_128
+            )
+
+        return cls(
+            city_hash_128,
+            CompressionMethod(codek),
+            compressed_size,
+            block_size,
+            view[HEADER.size:16 + compressed_size],
+            is_valid,
         )
 
     @classmethod
@@ -69,26 +166,97 @@ decompressed data size: {self.block_size} bytes"""
             msg = f"Unsupported file type {file.__class__}"
             raise NativeCompressFileError(msg)
 
-        city_hash_128 = file.read(16)
+        header = file.read(HEADER.size)
+
+        if not header:
+            msg = "EOF"
+            raise NativeCompressError(msg)
+
+        if len(header) < HEADER.size:
+            msg = "Incomplete compressed block header"
+            raise NativeCompressExtractError(msg)
+
+        CompressionMethod(header[16])
+        compressed_size, *_ = unpack("<L", header[17:21])
+
+        if compressed_size < 9:
+            msg = f"Invalid compressed block size {compressed_size}"
+            raise NativeCompressExtractError(msg)
+
+        buffer = bytearray(16 + compressed_size)
+        buffer[:HEADER.size] = header
+
+        if file.readinto(memoryview(buffer)[HEADER.size:]) < (
+            compressed_size - 9
+        ):
+            msg = "Incomplete compressed block data"
+            raise NativeCompressExtractError(msg)
+
+        return cls.from_buffer(buffer)
+
 
-        if len(city_hash_128) < 16:
+class BlockHeader(NamedTuple):
+    """Compressed block header with block offset in the file."""
+
+    city_hash_128: bytes
+    compression_codek: CompressionMethod
+    compressed_size: int
+    block_size: int
+    offset: int
+    is_valid: Optional[bool] = None
+
+    def __str__(self) -> str:
+        """String representation of the block header."""
+
+        hash_status = {
+            True: "Valid",
+            False: "Broken",
+            None: "Not checked",
+        }[self.is_valid]
+
+        return f"""hash: 0x{self.city_hash_128.hex().upper()}
+hash status: {hash_status}
+codek: {self.compression_codek.name}
+compressed block size: {self.compressed_size} bytes
+decompressed data size: {self.block_size} bytes
+offset: {self.offset}"""
+
+    @classmethod
+    def from_file(
+        cls,
+        file: Union[BytesIO, BufferedReader, BufferedWriter],
+    ) -> "BlockHeader":
+        """Read a block header and skip the compressed data."""
+
+        offset = file.tell()
+        header = file.read(25)
+
+        if not header:
             msg = "EOF"
             raise NativeCompressError(msg)
 
-        compression_codek = CompressionMethod(*unpack("B", file.read(1)))
-        compressed_size, *_ = unpack("<L", file.read(4))
-        block_size, *_ = unpack("<L", file.read(4))
-        compressed_data = file.read(compressed_size - 9)
-        file.seek(file.tell() - compressed_size)
-        is_valid = calc_hash(file.read(compressed_size)) == city_hash_128
+        if len(header) < 25:
+            msg = "Incomplete compressed block header"
+            raise ValueError(msg)
+
+        city_hash_128, codek, compressed_size, block_size = unpack(
+            "<16sB2L",
+            header,
+        )
+
+        if compressed_size < 9:
+            msg = f"Invalid compressed block size {compressed_size}"
+            raise ValueError(msg)
+
+        compression_codek = CompressionMethod(codek)
+        file.seek(offset + 16 + compressed_size)
 
         return cls(
             city_hash_128,
             compression_codek,
             compressed_size,
             block_size,
-            compressed_data,
-            is_valid,
+            offset,
         )
 
 
@@ -98,7 +266,8 @@ class FileBlocks(NamedTuple):
     compressed_size: int
     full_size: int
     total_blocks: int
-    block_list: list[BlockStruct]
+    block_list: list[Union[BlockStruct, BlockHeader]]
+    checksum_policy: Optional[ChecksumPolicy] = None
 
     def __str__(self) -> str:
         """String representation of the file."""
@@ -114,14 +283,24 @@ class FileBlocks(NamedTuple):
             blk_lst.is_valid
             for blk_lst in self.block_list
         }
-        hash_status = "Valid" if len(is_valid) == 1 and next(
-            iter(is_valid)
-        ) else "Broken"
+
+        if is_valid == {True}:
+            hash_status = "Valid"
+        elif is_valid and False not in is_valid:
+            hash_status = "Not checked"
+        else:
+            hash_status = "Broken"
+
+        if self.checksum_policy:
+            policy = self.checksum_policy.value
+        else:
+            policy = "not set"
 
         return f"""compressed size: {self.compressed_size} bytes
 decompressed size: {self.full_size} bytes
 codek: {codec}
 all blocks hash status: {hash_status}
+checksum policy: {policy}
 total blocks: {self.total_blocks}"""
 
     def write_file(
@@ -137,10 +316,9 @@ total blocks: {self.total_blocks}"""
             msg = f"Unsupported file type {file.__class__}"
             raise NativeCompressFileError(msg)
 
-        [
-            file.write(block.to_bytes())
-            for block in self.block_list
-        ]
+        for block in self.block_list:
+            file.write(block.header())
+            file.write(block.compressed_data)
 
     def to_bytes(self) -> bytes:
         """Return file as bytes."""
@@ -194,6 +372,8 @@ total blocks: {self.total_blocks}"""
                 block_list.append(block_struct)
                 total_blocks += 1
                 full_size += block_struct.block_size
+            except NativeCompressExtractError:
+                raise
             except NativeCompressError:
                 break
 
@@ -203,3 +383,44 @@ total blocks: {self.total_blocks}"""
             total_blocks,
             block_list,
         )
+
+    @classmethod
+    def from_headers(
+        cls,
+        file: Union[
+            BufferedIOBase,
+            BufferedReader,
+            BufferedWriter,
+            BytesIO,
+        ],
+        checksum_policy: Optional[ChecksumPolicy] = None,
+    ) -> "FileBlocks":
+        """Get a FileBlocks object with block headers only."""
+
+        full_size = 0
+        block_list = []
+
+        if isinstance(file, BufferedWriter) or not file.readable():
+            return cls(
+                0,
+                full_size,
+                0,
+                block_list,
+                checksum_policy,
+            )
+
+        while True:
+            try:
+                block_header = BlockHeader.from_file(file)
+                block_list.append(block_header)
+                full_size += block_header.block_size
+            except NativeCompressError:
+                break
+
+        return cls(
+            file.tell(),
+            full_size,
+            len(block_list),
+            block_list,
+            checksum_policy,
+        )
@@ -0,0 +1,230 @@
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+)
+
+from numpy import (
+    dtype,
+    frombuffer,
+    full,
+    packbits,
+    uint8,
+    unpackbits,
+    where,
+    zeros,
+)
+
+from .enums import CompressionMethod
+from .errors import (
+    NativeCompressExtractError,
+    NativeCompressPackError,
+)
+from .structs import BlockStruct
+
+
+# values of one transposed matrix
+MATRIX_SIZE = 64
+# transposition of whole bytes or bits in the first byte of the block
+VARIANT_BYTE = 0x00
+VARIANT_BIT = 0x80
+# Clickhouse T64 MagicNumber of the column type in the first byte
+# of the block and the integer type of its values
+T64_TYPES: Dict[int, dtype] = {
+    1: dtype("<u1"),  # UInt8
+    2: dtype("<u2"),  # UInt16
+    3: dtype("<u4"),  # UInt32
+    4: dtype("<u8"),  # UInt64
+    6: dtype("<i1"),  # Int8
+    7: dtype("<i2"),  # Int16
+    8: dtype("<i4"),  # Int32
+    9: dtype("<i8"),  # Int64
+    13: dtype("<u2"),  # Date
+    14: dtype("<u4"),  # DateTime
+    15: dtype("<i8"),  # DateTime64
+    17: dtype("<i1"),  # Enum8
+    18: dtype("<i2"),  # Enum16
+    19: dtype("<i4"),  # Decimal32
+    20: dtype("<i8"),  # Decimal64
+    21: dtype("<u4"),  # IPv4
+    22: dtype("<i4"),  # Date32
+}
+# UInt8, UInt16, UInt32 and UInt64 for value width 1, 2, 4 and 8 bytes
+T64_WIDTHS: Dict[int, int] = {
+    1: 1,
+    2: 2,
+    4: 3,
+    8: 4,
+}
+
+
+def valuable_bits(minimum: int, maximum: int, signed: bool) -> int:
+    """Number of low bits that differ in the values."""
+
+    if signed and minimum < 0 <= maximum:
+        if minimum + maximum >= 0:
+            return maximum.bit_length() + 1
+
+        return (~minimum).bit_length() + 1
+
+    mask = (1 << 64) - 1
+
+    return ((minimum & mask) ^ (maximum & mask)).bit_length()
+
+
+def upper_bits(
+    minimum: int,
+    maximum: int,
+    num_bits: int,
+    signed: bool,
+) -> Tuple[int, int, int]:
+    """Upper bits of negative and positive values and the sign bit."""
+
+    if num_bits >= 64:
+        return 0, 0, 0
+
+    mask = (1 << 64) - 1
+    upper_min = (minimum & mask) >> num_bits << num_bits
+
+    if signed and minimum < 0 <= maximum:
+        return (
+            upper_min,
+            (maximum & mask) >> num_bits << num_bits,
+            1 << (num_bits - 1),
+        )
+
+    return upper_min, upper_min, 0
+
+
+def t64_compress(
+    block_data: bytes,
+    compression_level: int = 0,
+    **_: dict[str, Any],
+) -> BlockStruct:
+    """Pack the block into T64, compression_level is the width
+    of UInt values in bytes: 1, 2, 4 or 8 (default)."""
+
+    type_id = T64_WIDTHS.get(compression_level or 8)
+
+    if not type_id or len(block_data) % (compression_level or 8):
+        msg = "T64 packs whole UInt8, UInt16, UInt32 or UInt64 values"
+        raise NativeCompressPackError(msg)
+
+    values_dtype = T64_TYPES[type_id]
+    values = frombuffer(block_data, values_dtype)
+    signed = values_dtype.kind == "i"
+    minimum = int(values.min()) if len(values) else 0
+    maximum = int(values.max()) if len(values) else 0
+    num_bits = (valuable_bits(minimum, maximum, signed) + 7) & ~7
+    chunks = [
+        bytes((type_id | VARIANT_BYTE,)),
+        minimum.to_bytes(8, "little", signed=signed),
+        maximum.to_bytes(8, "little", signed=signed),
+    ]
+
+    if num_bits:
+        matrices = zeros(
+            (-(-len(values) // MATRIX_SIZE), MATRIX_SIZE),
+            values_dtype,
+        )
+        matrices.ravel()[:len(values)] = values
+        chunks.append(
+            matrices.view(uint8).reshape(
+                len(matrices),
+                MATRIX_SIZE,
+                values_dtype.itemsize,
+            )[:, :, :num_bits // 8].transpose(0, 2, 1).tobytes()
+        )
+
+    return BlockStruct.from_data(
+        CompressionMethod.T64,
+        len(block_data),
+        b"".join(chunks),
+    )
+
+
+def t64_decompress(
+    block: BlockStruct,
+    **_: dict[str, Any],
+) -> bytes:
+    """Extract data from T64 block."""
+
+    data = memoryview(block.compressed_data)
+
+    if len(data) < 17 or data[0] & 0x7F not in T64_TYPES:
+        msg = "Corrupted T64 header"
+        raise NativeCompressExtractError(msg)
+
+    values_dtype = T64_TYPES[data[0] & 0x7F]
+    signed = values_dtype.kind == "i"
+    items_count = block.block_size // values_dtype.itemsize
+    minimum = int.from_bytes(data[1:9], "little", signed=signed)
+    maximum = int.from_bytes(data[9:17], "little", signed=signed)
+    num_bits = valuable_bits(minimum, maximum, signed)
+
+    if not num_bits:
+        return full(items_count, minimum, values_dtype).tobytes()
+
+    full_bytes, part_bits = divmod(num_bits, 8)
+
+    if not data[0] & VARIANT_BIT and part_bits:
+        full_bytes += 1
+        part_bits = 0
+
+    matrix_bytes = (full_bytes * 8 + part_bits) * 8
+    matrices_count = -(-items_count // MATRIX_SIZE)
+
+    if len(data) - 17 != matrices_count * matrix_bytes:
+        msg = "Corrupted T64 data"
+        raise NativeCompressExtractError(msg)
+
+    matrices = frombuffer(data[17:], uint8).reshape(
+        matrices_count,
+        matrix_bytes,
+    )
+    columns = zeros(
+        (matrices_count, MATRIX_SIZE, values_dtype.itemsize),
+        uint8,
+    )
+    columns[:, :, :full_bytes] = matrices[:, :full_bytes * 64].reshape(
+        matrices_count,
+        full_bytes,
+        MATRIX_SIZE,
+    ).transpose(0, 2, 1)
+
+    if part_bits:
+        planes = unpackbits(
+            matrices[:, full_bytes * 64:].reshape(
+                matrices_count,
+                part_bits,
+                8,
+            ),
+            axis=2,
+            bitorder="little",
+        )
+        columns[:, :, full_bytes] = packbits(
+            planes.transpose(0, 2, 1),
+            axis=2,
+            bitorder="little",
+        )[:, :, 0]
+
+    values = columns.view(values_dtype).ravel()[:items_count]
+    upper_min, upper_max, sign_bit = upper_bits(
+        minimum,
+        maximum,
+        full_bytes * 8 + part_bits,
+        signed,
+    )
+    unsigned = values.view(f"<u{values_dtype.itemsize}")
+    type_mask = (1 << values_dtype.itemsize * 8) - 1
+
+    if sign_bit:
+        unsigned = where(
+            unsigned & (sign_bit & type_mask),
+            unsigned | (upper_min & type_mask),
+            unsigned | (upper_max & type_mask),
+        )
+    else:
+        unsigned = unsigned | (upper_min & type_mask)
+
+    return unsigned.tobytes()
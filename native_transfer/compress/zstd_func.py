@@ -1,6 +1,15 @@
-from zstd import (
-    ZSTD_compress,
-    ZSTD_uncompress,
+from threading import local
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from zstandard import (
+    ZstdCompressionDict,
+    ZstdCompressor,
+    ZstdDecompressor,
 )
 
 from .calc_hash import block_hash
@@ -8,17 +17,60 @@ from .enums import CompressionMethod
 from .structs import BlockStruct
 
 
+# zstd contexts are not thread safe, so each thread keeps its own
+CONTEXTS = local()
+
+
+def zstd_compressor(
+    compression_level: int,
+    dictionary: Optional[ZstdCompressionDict] = None,
+) -> ZstdCompressor:
+    """Reusable compressor of the current thread."""
+
+    compressors: Dict[
+        Tuple[int, Optional[ZstdCompressionDict]],
+        ZstdCompressor,
+    ] = CONTEXTS.__dict__.setdefault("compressors", {})
+    key = (compression_level, dictionary)
+
+    if key not in compressors:
+        compressors[key] = ZstdCompressor(
+            level=compression_level,
+            dict_data=dictionary,
+        )
+
+    return compressors[key]
+
+
+def zstd_decompressor(
+    dictionary: Optional[ZstdCompressionDict] = None,
+) -> ZstdDecompressor:
+    """Reusable decompressor of the current thread."""
+
+    decompressors: Dict[
+        Optional[ZstdCompressionDict],
+        ZstdDecompressor,
+    ] = CONTEXTS.__dict__.setdefault("decompressors", {})
+
+    if dictionary not in decompressors:
+        decompressors[dictionary] = ZstdDecompressor(dict_data=dictionary)
+
+    return decompressors[dictionary]
+
+
 def zstd_compress(
     block_data: bytes,
     compression_level: int,
+    dictionary: Optional[ZstdCompressionDict] = None,
+    **_: dict[str, Any],
 ) -> BlockStruct:
     """Pack the block into ZSTD."""
 
     block_size = len(block_data)
-    compressed_data = ZSTD_compress(
-        block_data,
+    compressed_data = zstd_compressor(
         compression_level,
-    )
+        dictionary,
+    ).compress(block_data)
     compressed_size = len(compressed_data) + 9
     compression_codek = CompressionMethod.ZSTD
     city_hash_128 = block_hash(
@@ -38,7 +90,14 @@ def zstd_compress(
     )
 
 
-def zstd_decompress(block: BlockStruct) -> bytes:
+def zstd_decompress(
+    block: BlockStruct,
+    dictionary: Optional[ZstdCompressionDict] = None,
+    **_: dict[str, Any],
+) -> bytes:
     """Extract data from ZSTD block."""
 
-    return ZSTD_uncompress(block.compressed_data)
+    return zstd_decompressor(dictionary).decompress(
+        block.compressed_data,
+        max_output_size=block.block_size,
+    )
@@ -8,13 +8,25 @@ from ipaddress import IPv4Address, IPv6Address
 from typing import (
     Any,
     Dict,
+    List,
+    Union,
 )
 from uuid import UUID
 
+from numpy import (
+    asarray,
+    ndarray,
+    uint8,
+)
+from pandas import Series as PdSeries
+from polars import Series as PlSeries
+
+from .errors import dtype_error
+
 
 NILL_VALUES: Dict[type, Any] = {
     int: 0,
-    float: 0,
+    float: 0.0,
     str: "",
     date: date(1970, 1, 1),
     datetime: datetime(1970, 1, 1, tzinfo=timezone.utc),
@@ -26,10 +38,63 @@ NILL_VALUES: Dict[type, Any] = {
 }
 
 
+def null_value(dtype: Union[type, Dict[int, str]]) -> Any:
+    """Default value for current data type."""
+
+    if isinstance(dtype, dict):
+        return next(iter(dtype))  # Enum8/Enum16 first declared value
+
+    return NILL_VALUES.get(dtype)
+
+
 def null_correction(value: Any, dtype: type) -> Any:
     """Replacing None values with default values for current data type."""
 
     if value is None:
-        return NILL_VALUES.get(dtype)
+        return null_value(dtype)
 
     return value
+
+
+def null_map_pandas(series: PdSeries) -> ndarray:
+    """Null map from pandas.Series (1 - NULL, 0 - value)."""
+
+    return series.isna().to_numpy(dtype=uint8)
+
+
+def null_map_polars(series: PlSeries) -> ndarray:
+    """Null map from polars.Series validity bitmap (1 - NULL, 0 - value)."""
+
+    return series.is_null().to_numpy().view(uint8)
+
+
+SERIES_NULL_MAP: Dict[type, object] = {
+    PdSeries: null_map_pandas,
+    PlSeries: null_map_polars,
+}
+
+
+def null_map(series: Union[PdSeries, PlSeries]) -> ndarray:
+    """Null map for Nullable(T) column."""
+
+    return SERIES_NULL_MAP.get(series.__class__, dtype_error)(series)
+
+
+def null_map_values(values: List[Any]) -> ndarray:
+    """Null map from python values (1 - NULL, 0 - value)."""
+
+    return asarray([value is None for value in values], dtype=uint8)
+
+
+def fill_nulls(
+    values: List[Any],
+    nulls: ndarray,
+    dtype: Union[type, Dict[int, str]],
+) -> ndarray:
+    """Replacing NULL values with default values in bulk."""
+
+    filled: ndarray = ndarray(len(values), dtype=object)
+    filled[:] = values
+    filled[nulls.view(bool)] = null_value(dtype)
+
+    return filled
@@ -6,9 +6,12 @@ from ipaddress import (
     IPv4Address,
     IPv6Address,
 )
+from copy import copy
+from functools import lru_cache
 from re import (
     Match,
-    search,
+    Pattern,
+    compile,
 )
 from typing import (
     Dict,
@@ -82,14 +85,35 @@ from .uuids import (
 from ..errors import NativeDTypeError
 
 
+# Count of distinct data type strings with parsed column codecs
+DTYPE_CACHE_SIZE: int = 1024
+DTYPE_PATTERN: Pattern = compile(r"^(\w+)(?:\((.*?)\))?$")
+
+
 def get_dtype(
     raw_string: str,
     total_rows: Optional[int] = None,
 ) -> Union[Array, DType, LowCardinality]:
     """Get DType object to work with specified data type.."""
 
-    pattern: str = r"^(\w+)(?:\((.*?)\))?$"
-    match: Optional[Match] = search(pattern, raw_string)
+    codec: Union[Array, DType, LowCardinality] = compile_dtype(raw_string)
+
+    if isinstance(codec, DType):
+        return codec._replace(total_rows=total_rows)
+
+    codec = copy(codec)
+    codec.total_rows = total_rows
+
+    return codec
+
+
+@lru_cache(maxsize=DTYPE_CACHE_SIZE)
+def compile_dtype(raw_string: str) -> Union[Array, DType, LowCardinality]:
+    """Parse data type string once into reusable column codec.
+    Row count is passed to read/write/skip for every block."""
+
+    total_rows: Optional[int] = None  # passed to read/write/skip
+    match: Optional[Match] = DTYPE_PATTERN.search(raw_string)
 
     if not match:
         raise NativeDTypeError("Invalid type format.")
@@ -99,7 +123,7 @@ def get_dtype(
     # Провести рефактор этого места. Когда-нибудь)
 
     if dtype == "Array":
-        return Array(get_dtype(match.group(2)), total_rows)
+        return Array(compile_dtype(match.group(2)), total_rows)
     elif dtype == "Bool":
         return DType(dtype, bool, read_bool, write_bool, total_rows, 1)
     elif dtype == "Nullable":
@@ -110,7 +134,7 @@ def get_dtype(
             write_nullable,
             total_rows,
             1,
-            nullables=get_dtype(match.group(2), total_rows),
+            nullables=compile_dtype(match.group(2)),
         )
     elif dtype == "Nothing":
         return DType(
@@ -128,7 +152,7 @@ def get_dtype(
             write_datetime,
             total_rows,
             4,
-            tzinfo=match.group(2),
+            tzinfo=(match.group(2) or "").strip("'") or None,
         )
     elif dtype == "DateTime64":
         args: str = match.group(2)
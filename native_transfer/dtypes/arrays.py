@@ -1,12 +1,14 @@
 from io import BufferedIOBase
+from itertools import chain
 from typing import (
     Any,
-    Dict,
     List,
     Optional,
     Tuple,
 )
 
+from numpy import ndarray
+
 from .struct import DType
 from .integers import (
     read_uint,
@@ -17,53 +19,63 @@ from .integers import (
 class Array:
     """Class for read and write array items."""
 
-    def __init__(self: "Array", item: DType, total_rows: int) -> None:
+    def __init__(
+        self: "Array",
+        item: DType,
+        total_rows: Optional[int] = None,
+    ) -> None:
         """Class initialization."""
 
         self.item: DType = item
-        self.total_rows: int = total_rows
-        self.row_elements: List[Tuple[int, int]] = []
-        self.total_items: int = 0
+        self.total_rows: Optional[int] = total_rows
+
+    def rows(self: "Array", total_count: Optional[int] = None) -> int:
+        """Row count of current block."""
 
-    def read(self: "Array", file: BufferedIOBase) -> List[List[Any]]:
+        if total_count is None:
+            return self.total_rows or 0
+
+        return total_count
+
+    def read(
+        self: "Array",
+        file: BufferedIOBase,
+        total_count: Optional[int] = None,
+    ) -> List[List[Any]]:
         """Read Arrays."""
 
-        for _ in range(self.total_rows):
+        row_elements: List[Tuple[int, int]] = []
+        total_items: int = 0
+
+        for _ in range(self.rows(total_count)):
             row: int = read_uint(file, 8)
-            self.row_elements.append(
+            row_elements.append(
                 (
-                    self.total_items,
+                    total_items,
                     row,
                 )
             )
-            self.total_items = row
+            total_items = row
 
-        item_params: Dict[str, Any] = self.item._asdict()
-        item_params["total_rows"] = self.total_items
-        self.item: DType = DType(**item_params)
-        items: List[Any] = self.item.read(file)
+        items: List[Any] = self.item.read(file, total_items)
 
-        return [items[start:stop] for start, stop in self.row_elements]
+        return [items[start:stop] for start, stop in row_elements]
 
     def write(
-        self: "Array", values: List[List[Any]], file: BufferedIOBase
+        self: "Array",
+        values: List[List[Any]],
+        file: BufferedIOBase,
+        *_: Optional[ndarray],
     ) -> None:
         """Write Arrays."""
 
-        self.total_rows: int = len(values)
         num: int = 0
 
         for value in values:
             num += len(value)
             write_uint(num, file, 8)
 
-        values: List[Any] = sum(values, [])
-        self.total_items: int = len(values)
-        item_params: Dict[str, Any] = self.item._asdict()
-        item_params["total_rows"] = self.total_items
-        self.item: DType = DType(**item_params)
-
-        self.item.write(values, file)
+        self.item.write(list(chain.from_iterable(values)), file)
 
     def skip(
         self: "Array",
@@ -72,7 +84,11 @@ class Array:
     ) -> None:
         """Skip Arrays block."""
 
-        total_rows: int = self.total_rows or total_count
+        total_rows: int = self.rows(total_count)
+
+        if not total_rows:
+            return
+
         file.seek(file.tell() + (8 * (total_rows - 1)))
         _total_count: int = read_uint(file, 8)
         self.item.skip(file, _total_count)
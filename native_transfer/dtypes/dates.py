@@ -46,6 +46,10 @@ def unpack_datetime(seconds: Union[int, float]) -> datetime:
 def pack_datetime(datetimeobj: datetime) -> Union[int, float]:
     """Pack datetime into count seconds or ticks."""
 
+    if datetimeobj.tzinfo is None:
+        # naive pandas.Timestamp as local time like naive datetime
+        datetimeobj = datetime.combine(datetimeobj.date(), datetimeobj.time())
+
     return (datetimeobj.astimezone(timezone.utc) - DATA).total_seconds()
 
 
@@ -202,7 +206,7 @@ def write_datetime64(
     """Write DateTime64 into Native Format."""
 
     precission: int = args[2]
-    seconds: int = int(pack_datetime(datetimeobj)) // pow(10, -precission)
+    seconds: int = round(pack_datetime(datetimeobj) * pow(10, precission))
 
     try:
         file.write(pack("<q", seconds))
@@ -4,6 +4,8 @@ from typing import (
     Union,
 )
 
+from ..lens import read_exact
+
 
 INTEGER_LENS: Dict[str, int] = {
     "UInt8": 1,
@@ -32,7 +34,7 @@ def read_int(
 ) -> int:
     """Read signed integer from Native Format."""
 
-    return int.from_bytes(file.read(lens), "little", signed=True)
+    return int.from_bytes(read_exact(file, lens), "little", signed=True)
 
 
 def write_int(
@@ -61,7 +63,7 @@ def read_uint(
 ) -> int:
     """Read unsigned integer from Native Format."""
 
-    return int.from_bytes(file.read(lens), "little", signed=False)
+    return int.from_bytes(read_exact(file, lens), "little", signed=False)
 
 
 def write_uint(
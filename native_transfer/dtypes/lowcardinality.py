@@ -5,7 +5,8 @@ from datetime import (
 from io import BufferedIOBase
 from re import (
     Match,
-    search,
+    Pattern,
+    compile,
 )
 from typing import (
     Any,
@@ -32,10 +33,12 @@ from .integers import (
     read_uint,
     INTEGER_LENS,
 )
-from .strings import read_string
+from .strings import (
+    read_string,
+    skip_strings,
+)
 
 from ..errors import NativeDTypeError
-from ..lens import read_lens
 
 
 __doc__ = """
@@ -60,6 +63,7 @@ but the element with index 0 corresponds to None, and the element with index 1 c
 I see no point in packing all this back, so this class will be intended only for reading from Native Format.
 """  # noqa: E501
 
+LC_PATTERN: Pattern = compile(r"^(\w+)(?:\((.*?)\))?$")
 LCType = TypeVar(
     "LCType",
     str,
@@ -84,15 +88,14 @@ class LowCardinality:
     ) -> None:
         """Class initialization."""
 
-        pattern: str = r"^(\w+)(?:\((.*?)\))?$"
-        match: Optional[Match] = search(pattern, raw_string)
+        match: Optional[Match] = LC_PATTERN.search(raw_string)
 
         if not match:
             raise NativeDTypeError("Invalid LowCardinality parameters.")
 
         if match.group(1) == "Nullable":
             self.nullable: bool = True
-            match: Optional[Match] = search(pattern, match.group(2))
+            match: Optional[Match] = LC_PATTERN.search(match.group(2))
         else:
             self.nullable: bool = False
 
@@ -118,7 +121,7 @@ class LowCardinality:
         elif self.name == "DateTime":
             self.dtype = datetime
             self.lens = 4
-            self.tzinfo = match.group(2)
+            self.tzinfo = (match.group(2) or "").strip("'") or None
             self.read_func = read_datetime
         elif self.name[:3] == "Int":
             self.dtype = int
@@ -172,7 +175,11 @@ class LowCardinality:
 
         return count_elements, index_lens
 
-    def read(self: "LowCardinality", file: BufferedIOBase) -> List[LCType]:
+    def read(
+        self: "LowCardinality",
+        file: BufferedIOBase,
+        _: Optional[int] = None,
+    ) -> List[LCType]:
         """Read items from LowCardinality block."""
 
         count_elements, index_lens = self._read_values(file)
@@ -210,9 +217,7 @@ class LowCardinality:
         count_elements, index_lens = self._read_values(file)
 
         if self.lens is None:
-            for _ in range(count_elements):
-                lens = read_lens(file)
-                file.seek(file.tell() + lens)
+            skip_strings(file, count_elements)
         else:
             file.seek(file.tell() + (self.lens * count_elements))
 
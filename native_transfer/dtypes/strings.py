@@ -1,13 +1,18 @@
+from gzip import GzipFile
 from io import BufferedIOBase
 from typing import (
     Optional,
+    Tuple,
     Union,
 )
 
+from ..errors import NativeDTypeError
 from ..lens import (
+    read_exact,
     read_lens,
     write_lens,
 )
+from ..streams import StreamReader
 
 
 def read_string(
@@ -27,7 +32,7 @@ def read_string(
     if lens == 0:
         return ""
 
-    return file.read(lens).decode("utf-8")
+    return read_exact(file, lens).decode("utf-8")
 
 
 def write_string(
@@ -50,8 +55,84 @@ def write_string(
     if not lens:
         lens: int = len(byte_str)
         write_lens(lens, file)
+    elif len(byte_str) != lens:
+        msg = f"String of {len(byte_str)} bytes not match FixedString({lens})."
+        raise NativeDTypeError(msg)
 
     if lens == 0:
         return  # Чтобы не писать в файл пустоту
 
     file.write(byte_str)
+
+
+# Max bytes looked ahead to skip String values in bulk
+SKIP_BUFFER: int = 1048576
+
+
+def peek_bytes(file: BufferedIOBase, size: int) -> bytes:
+    """Up to size bytes from current position without moving it."""
+
+    if hasattr(file, "lookahead"):
+        # ForwardCursor can't seek back, looks ahead into its chunks
+        return file.lookahead(size)
+
+    if isinstance(file, Union[GzipFile, StreamReader]):
+        # backward seek restarts decompression, window is the read buffer
+        return file.peek(size)
+
+    position: int = file.tell()
+    window: bytes = file.read(size)
+    file.seek(position)
+
+    return window
+
+
+def scan_strings(window: bytes, total_rows: int) -> Tuple[int, int]:
+    """Count complete String values in window (rows, bytes)."""
+
+    size: int = len(window)
+    position: int = 0
+    rows: int = 0
+
+    while rows < total_rows:
+        cursor: int = position
+        lens: int = 0
+        shift: int = 0
+
+        while cursor < size:
+            _byte: int = window[cursor]
+            cursor += 1
+            lens |= (_byte & 0x7F) << shift
+
+            if _byte < 0x80:
+                break
+
+            shift += 7
+        else:
+            break  # length prefix crosses window
+
+        if cursor + lens > size:
+            break  # string crosses window
+
+        position = cursor + lens
+        rows += 1
+
+    return rows, position
+
+
+def skip_strings(file: BufferedIOBase, total_rows: int) -> None:
+    """Skip String values scanning length prefixes over large reads."""
+
+    while total_rows > 0:
+        rows, position = scan_strings(
+            peek_bytes(file, SKIP_BUFFER),
+            total_rows,
+        )
+
+        if rows:
+            file.seek(file.tell() + position)
+            total_rows -= rows
+        else:
+            lens: int = read_lens(file)
+            file.seek(file.tell() + lens)
+            total_rows -= 1
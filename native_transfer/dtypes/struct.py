@@ -1,14 +1,81 @@
 from io import BufferedIOBase
 from typing import (
     Any,
+    Dict,
     List,
     NamedTuple,
     Optional,
 )
 
-from ..defaults import null_correction
+from numpy import (
+    asarray,
+    dtype as np_dtype,
+    iinfo,
+    ndarray,
+)
+
+from ..defaults import (
+    fill_nulls,
+    null_correction,
+    null_map_values,
+)
 from ..errors import NativeDTypeError
-from ..lens import read_lens
+from .strings import skip_strings
+
+
+# Fixed width data types written with one numpy buffer
+VECTOR_DTYPES: Dict[str, str] = {
+    "Bool": "?",
+    "UInt8": "<u1",
+    "UInt16": "<u2",
+    "UInt32": "<u4",
+    "UInt64": "<u8",
+    "Int8": "<i1",
+    "Int16": "<i2",
+    "Int32": "<i4",
+    "Int64": "<i8",
+    "Float32": "<f4",
+    "Float64": "<f8",
+}
+# numpy kinds of values cast into the buffer without the type check
+VECTOR_KINDS: Dict[str, str] = {
+    "b": "b",
+    "i": "iu",
+    "u": "iu",
+    "f": "f",
+}
+
+
+def vector_values(
+    values: List[Any],
+    dtype: type,
+    vector: str,
+) -> Optional[ndarray]:
+    """Values cast into one numpy buffer,
+    None if they must pass the type check one by one."""
+
+    array: ndarray = asarray(values)
+
+    if array.dtype.kind == "O":
+        nulls: ndarray = null_map_values(array)
+
+        if nulls.any():
+            array = fill_nulls(array, nulls, dtype)
+
+        array = asarray(array.tolist())
+
+    target = np_dtype(vector)
+
+    if array.dtype.kind not in VECTOR_KINDS[target.kind]:
+        return None
+
+    if target.kind in "iu":
+        limits = iinfo(target)
+
+        if array.min() < limits.min or array.max() > limits.max:
+            return None
+
+    return array.astype(target, copy=False)
 
 
 class DType(NamedTuple):
@@ -56,15 +123,29 @@ class DType(NamedTuple):
             self.dtype,
         )
 
-    def read(self: "DType", file: BufferedIOBase) -> List[Any]:
+    def rows(self: "DType", total_count: Optional[int] = None) -> int:
+        """Row count of current block."""
+
+        if total_count is None:
+            return self.total_rows or 0
+
+        return total_count
+
+    def read(
+        self: "DType",
+        file: BufferedIOBase,
+        total_count: Optional[int] = None,
+    ) -> List[Any]:
         """Read block items."""
 
-        if not self.total_rows:
+        total_rows: int = self.rows(total_count)
+
+        if not total_rows:
             return []
 
         if self.nullables:
             not_empty: List[bool] = [
-                self._read(file) for _ in range(self.total_rows)
+                self._read(file) for _ in range(total_rows)
             ]
 
             def read_nullable(num) -> Any | None:
@@ -73,27 +154,52 @@ class DType(NamedTuple):
                 if not_empty[num]:
                     return value
 
-            return [read_nullable(num) for num in range(self.total_rows)]
+            return [read_nullable(num) for num in range(total_rows)]
 
-        return [self._read(file) for _ in range(self.total_rows)]
+        return [self._read(file) for _ in range(total_rows)]
+
+    def _write_values(
+        self: "DType",
+        values: List[Any],
+        file: BufferedIOBase,
+    ) -> None:
+        """Write values without null map into Native Format."""
 
-    def write(self: "DType", values: List[Any], file: BufferedIOBase) -> None:
+        if self.name in VECTOR_DTYPES:
+            array: Optional[ndarray] = vector_values(
+                values,
+                self.dtype,
+                VECTOR_DTYPES[self.name],
+            )
+
+            if array is not None:
+                file.write(array.tobytes())
+                return
+
+        [self._write(value, file) for value in values]
+
+    def write(
+        self: "DType",
+        values: List[Any],
+        file: BufferedIOBase,
+        null_map: Optional[ndarray] = None,
+    ) -> None:
         """Write block items."""
 
-        if not self.total_rows:
+        if not len(values):
             return
 
         if self.nullables:
-
-            def write_nullable(value) -> bool:
-                if value is None:
-                    return False
-                return True
-
-            [self._write(write_nullable(value), file) for value in values]
-            [self.nullables._write(value, file) for value in values]
+            if null_map is None:
+                null_map = null_map_values(values)
+
+            file.write(null_map.tobytes())
+            self.nullables._write_values(
+                fill_nulls(values, null_map, self.nullables.dtype),
+                file,
+            )
         else:
-            [self._write(value, file) for value in values]
+            self._write_values(values, file)
 
     def skip(
         self: "DType",
@@ -102,12 +208,10 @@ class DType(NamedTuple):
     ) -> None:
         """Skip block."""
 
-        total_rows: int = self.total_rows or total_count
+        total_rows: int = self.rows(total_count)
 
         if self.lens is None:
-            for _ in range(total_rows):
-                lens = read_lens(file)
-                file.seek(file.tell() + lens)
+            skip_strings(file, total_rows)
         else:
             file.seek(file.tell() + (self.lens * total_rows))
 
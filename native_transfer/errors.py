@@ -17,6 +17,16 @@ class NativeWriteError(NativeError):
     """Write error."""
 
 
+class NativeHttpError(NativeWriteError):
+    """Clickhouse HTTP interface answered with an error."""
+
+    def __init__(self: "NativeHttpError", msg: str, status: int) -> None:
+        """Error with HTTP status of the answer."""
+
+        super().__init__(msg)
+        self.status = status
+
+
 class NativeEnumError(ValueError):
     """Enum error."""
 
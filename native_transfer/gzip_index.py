@@ -0,0 +1,252 @@
+from bisect import bisect_right
+from io import BufferedIOBase
+from os import PathLike
+from os.path import exists
+from struct import Struct
+from typing import (
+    Any,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+from zlib import (
+    MAX_WBITS,
+    compress,
+    decompress,
+    decompressobj,
+    error as ZlibError,
+)
+
+from .errors import NativeReadError
+
+
+# compressed bytes read from the file at once
+READ_SIZE = 1048576
+# zlib wbits for gzip header and trailer
+GZIP_WBITS = MAX_WBITS | 16
+# zlib wbits for deflate data without gzip header
+RAW_WBITS = -MAX_WBITS
+# deflate history needed to resume decompression
+WINDOW_SIZE = 32768
+# decompressed bytes between seek points
+SPAN = 8388608
+# empty stored block written by Z_SYNC_FLUSH and Z_FULL_FLUSH
+SYNC_MARKER = b"\x00\x00\xff\xff"
+# compressed bytes used to check a sync marker
+PROBE_SIZE = 4096
+# gzip member trailer: crc32 and isize
+TRAILER_SIZE = 8
+# sidecar file suffix
+INDEX_SUFFIX = ".gzidx"
+INDEX_MAGIC = b"NTGZIDX1"
+# magic, span, total points
+INDEX_HEADER = Struct("<8s2Q")
+# compressed offset, decompressed position, packed window size
+POINT_HEADER = Struct("<2QL")
+
+
+class SeekPoint(NamedTuple):
+    """Place where gzip decompression can be restarted."""
+
+    compressed: int
+    position: int
+    window: bytes
+
+    def decompressor(self) -> Any:
+        """Decompressor starting at the seek point."""
+
+        if self.window:
+            return decompressobj(RAW_WBITS, zdict=self.window)
+
+        return decompressobj(GZIP_WBITS)
+
+
+def check_point(
+    decompressor: Any,
+    window: bytes,
+    probe: bytes,
+) -> bool:
+    """Check that raw deflate resumes after the sync marker."""
+
+    expected = decompressor.copy().decompress(probe)
+
+    try:
+        resumed = decompressobj(RAW_WBITS, zdict=window).decompress(probe)
+    except ZlibError:
+        return False
+
+    return resumed == expected
+
+
+class GzipIndex(NamedTuple):
+    """Seek points of gzip file every span decompressed bytes."""
+
+    span: int
+    points: List[SeekPoint]
+
+    def __str__(self) -> str:
+        """String representation of the index."""
+
+        return f"""span: {self.span} bytes
+total points: {len(self.points)}"""
+
+    def find(self, position: int) -> SeekPoint:
+        """Last seek point before the decompressed position."""
+
+        return self.points[
+            bisect_right(
+                [point.position for point in self.points],
+                position,
+            ) - 1
+        ]
+
+    def write_file(self, file: BufferedIOBase) -> None:
+        """Write the index into a sidecar file."""
+
+        file.write(
+            INDEX_HEADER.pack(INDEX_MAGIC, self.span, len(self.points))
+        )
+
+        for point in self.points:
+            window = compress(point.window) if point.window else b""
+            file.write(
+                POINT_HEADER.pack(
+                    point.compressed,
+                    point.position,
+                    len(window),
+                )
+            )
+            file.write(window)
+
+    def save(self, path: Union[str, PathLike]) -> None:
+        """Save the index into a sidecar file."""
+
+        with open(path, "wb") as file:
+            self.write_file(file)
+
+    @classmethod
+    def from_index(cls, file: BufferedIOBase) -> "GzipIndex":
+        """Read the index from a sidecar file."""
+
+        header = file.read(INDEX_HEADER.size)
+
+        if len(header) < INDEX_HEADER.size:
+            msg = "Incomplete gzip index header"
+            raise NativeReadError(msg)
+
+        magic, span, total_points = INDEX_HEADER.unpack(header)
+
+        if magic != INDEX_MAGIC:
+            msg = "Not a gzip index file"
+            raise NativeReadError(msg)
+
+        points = []
+
+        for _ in range(total_points):
+            compressed, position, size = POINT_HEADER.unpack(
+                file.read(POINT_HEADER.size)
+            )
+            window = decompress(file.read(size)) if size else b""
+            points.append(SeekPoint(compressed, position, window))
+
+        return cls(span, points)
+
+    @classmethod
+    def load(cls, path: Union[str, PathLike]) -> "GzipIndex":
+        """Load the index from a sidecar file."""
+
+        with open(path, "rb") as file:
+            return cls.from_index(file)
+
+    @classmethod
+    def from_file(
+        cls,
+        file: BufferedIOBase,
+        span: int = SPAN,
+    ) -> "GzipIndex":
+        """Build the index with one pass over the gzip file.
+        Seek points are gzip member starts and sync flush markers."""
+
+        start = file.tell()
+        points = [SeekPoint(0, 0, b"")]
+        decompressor = decompressobj(GZIP_WBITS)
+        history = bytearray()
+        position = 0
+        offset = 0
+        data = b""
+        pos = 0
+        ended = False
+
+        while True:
+            if not ended and len(data) - pos < PROBE_SIZE:
+                chunk = file.read(READ_SIZE)
+                ended = not chunk
+                data = data[pos:] + chunk
+                pos = 0
+
+            if pos >= len(data):
+                break
+
+            if decompressor.eof:
+                decompressor = decompressobj(GZIP_WBITS)
+
+                if position - points[-1].position >= span:
+                    points.append(SeekPoint(offset, position, b""))
+
+            marker = data.find(SYNC_MARKER, pos)
+
+            if marker >= 0:
+                end = marker + len(SYNC_MARKER)
+            elif ended:
+                end = len(data)
+            else:
+                end = len(data) - len(SYNC_MARKER) + 1
+
+            output = decompressor.decompress(data[pos:end])
+            position += len(output)
+            history.extend(output[-WINDOW_SIZE:])
+            del history[:-WINDOW_SIZE]
+
+            if decompressor.eof:
+                end -= len(decompressor.unused_data)
+            elif (
+                marker >= 0
+                and position - points[-1].position >= span
+                and check_point(
+                    decompressor,
+                    bytes(history),
+                    data[end:end + PROBE_SIZE],
+                )
+            ):
+                points.append(
+                    SeekPoint(offset + end - pos, position, bytes(history))
+                )
+
+            offset += end - pos
+            pos = end
+
+        file.seek(start)
+
+        return cls(span, points)
+
+
+def sidecar_index(
+    file: BufferedIOBase,
+    span: int = SPAN,
+) -> GzipIndex:
+    """Load the index saved next to the gzip file,
+    build and save it when missing."""
+
+    name: Optional[str] = getattr(file, "name", None)
+    path = f"{name}{INDEX_SUFFIX}" if isinstance(name, str) else None
+
+    if path and exists(path):
+        return GzipIndex.load(path)
+
+    index = GzipIndex.from_file(file, span)
+
+    if path:
+        index.save(path)
+
+    return index
@@ -0,0 +1,316 @@
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPResponse,
+    HTTPSConnection,
+)
+from logging import (
+    Logger,
+    getLogger,
+)
+from select import select
+from threading import Lock
+from typing import (
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+from urllib.parse import (
+    urlencode,
+    urlsplit,
+)
+
+from .errors import NativeHttpError
+from .streams import (
+    StreamEncoder,
+    StreamMethod,
+)
+
+
+CONTENT_ENCODINGS: Dict[StreamMethod, str] = {
+    StreamMethod.GZIP: "gzip",
+    StreamMethod.ZSTD: "zstd",
+    StreamMethod.LZ4: "lz4",
+}
+# seconds to wait for Clickhouse answer
+TIMEOUT = 600
+# seconds before the next attempt, multiplied by the attempt number
+RETRY_DELAY = 1.0
+
+
+class ShardResult(NamedTuple):
+    """Result of one inserted shard."""
+
+    shard_num: int
+    rows: int
+    size: int
+    seconds: float
+    attempts: int
+
+
+class InsertReport(NamedTuple):
+    """Result of parallel insert."""
+
+    shards: int
+    rows: int
+    size: int
+    seconds: float
+    retries: int
+
+    def __str__(self) -> str:
+        """String representation of the report."""
+
+        seconds = self.seconds or 1e-9
+
+        return f"""shards: {self.shards}
+rows: {self.rows}
+size: {self.size} bytes
+time: {self.seconds:.3f} s
+retries: {self.retries}
+throughput: {self.rows / seconds:.0f} rows/s, \
+{self.size / seconds / 1048576:.2f} MiB/s"""
+
+    @classmethod
+    def from_results(
+        cls,
+        results: List[ShardResult],
+        seconds: float,
+    ) -> "InsertReport":
+        """Sum results of all shards."""
+
+        return cls(
+            len(results),
+            sum(result.rows for result in results),
+            sum(result.size for result in results),
+            seconds,
+            sum(result.attempts - 1 for result in results),
+        )
+
+
+class BlockCounter:
+    """Iterator over Native blocks counting sent bytes."""
+
+    def __init__(self, blocks: Iterable[bytes]) -> None:
+        """Class initialization."""
+
+        self.blocks = iter(blocks)
+        self.size = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Return the iterator."""
+
+        return self
+
+    def __next__(self) -> bytes:
+        """Next block."""
+
+        block = next(self.blocks)
+        self.size += len(block)
+
+        return block
+
+
+def encode_chunks(
+    chunks: Iterable[bytes],
+    method: StreamMethod,
+    level: Optional[int] = None,
+) -> Generator[bytes, None, None]:
+    """Compress chunks into one gzip, zstd or LZ4 frame stream."""
+
+    encoder = StreamEncoder(method, level)
+
+    for chunk in chunks:
+        yield encoder.compress(chunk)
+
+    yield encoder.flush()
+
+
+def retryable(err: Exception) -> bool:
+    """Transport errors and 5xx answers may pass on the next attempt,
+    errors of encoding and 4xx answers repeat every time."""
+
+    if isinstance(err, NativeHttpError):
+        return err.status >= 500
+
+    return isinstance(err, (OSError, HTTPException))
+
+
+def connection_alive(connection: HTTPConnection) -> bool:
+    """Check idle keep-alive connection was not closed by the server,
+    a readable idle socket means EOF or a stray answer."""
+
+    if connection.sock is None:
+        return False
+
+    try:
+        readable, *_ = select([connection.sock], [], [], 0)
+    except (OSError, ValueError):
+        return False
+
+    return not readable
+
+
+class HttpInsert:
+    """Streaming INSERT ... FORMAT Native into Clickhouse HTTP interface
+    over pooled keep-alive connections."""
+
+    def __init__(
+        self,
+        url: str = "http://localhost:8123",
+        user: str = "default",
+        password: str = "",
+        database: str = "default",
+        content_encoding: Optional[StreamMethod] = None,
+        compress_level: Optional[int] = None,
+        settings: Optional[Dict[str, str]] = None,
+        timeout: float = TIMEOUT,
+        logs: Logger = getLogger(__name__),
+    ) -> None:
+        """Class initialization."""
+
+        address = urlsplit(url)
+        self.connection_class = {
+            "http": HTTPConnection,
+            "https": HTTPSConnection,
+        }[address.scheme]
+        self.host = address.hostname
+        self.port = address.port
+        self.path = address.path or "/"
+        self.database = database
+        self.content_encoding = content_encoding
+        self.compress_level = compress_level
+        self.settings = settings or {}
+        self.timeout = timeout
+        self.logs = logs
+        self.headers = {
+            "X-ClickHouse-User": user,
+            "X-ClickHouse-Key": password,
+            "X-ClickHouse-Format": "Native",
+        }
+        self.pool: List[HTTPConnection] = []
+        self.lock = Lock()
+
+        if content_encoding:
+            self.headers["Content-Encoding"] = CONTENT_ENCODINGS[
+                content_encoding
+            ]
+
+    def __enter__(self) -> "HttpInsert":
+        """Launch the context manager."""
+
+        return self
+
+    def __exit__(
+        self,
+        *_: object,
+    ) -> None:
+        """Exit context manager."""
+
+        self.close()
+
+    def connection(self) -> HTTPConnection:
+        """Take idle connection from the pool or open a new one."""
+
+        with self.lock:
+            while self.pool:
+                connection = self.pool.pop()
+
+                if connection_alive(connection):
+                    return connection
+
+                connection.close()
+
+        return self.connection_class(
+            self.host,
+            self.port,
+            timeout=self.timeout,
+        )
+
+    def release(
+        self,
+        connection: HTTPConnection,
+        response: HTTPResponse,
+    ) -> None:
+        """Return connection to the pool if the server keeps it alive."""
+
+        if response.will_close:
+            connection.close()
+            return
+
+        with self.lock:
+            self.pool.append(connection)
+
+    def query(
+        self,
+        table: str,
+        settings: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Request path with INSERT query and settings."""
+
+        params = {
+            "database": self.database,
+            "query": f"INSERT INTO {table} FORMAT Native",
+            **self.settings,
+            **(settings or {}),
+        }
+
+        return f"{self.path}?{urlencode(params)}"
+
+    def insert(
+        self,
+        table: str,
+        blocks: Iterable[bytes],
+        settings: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Send Native blocks with chunked transfer encoding
+        as they are produced, return Clickhouse summary."""
+
+        if self.content_encoding:
+            blocks = encode_chunks(
+                blocks,
+                self.content_encoding,
+                self.compress_level,
+            )
+
+        connection = self.connection()
+
+        try:
+            connection.request(
+                "POST",
+                self.query(table, settings),
+                body=blocks,
+                headers=self.headers,
+                encode_chunked=True,
+            )
+            response = connection.getresponse()
+            answer = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        self.release(connection, response)
+
+        if response.status != 200:
+            msg = (
+                f"Insert into {table} failed with HTTP {response.status}: "
+                f"{answer.decode(errors='replace').strip()}"
+            )
+            raise NativeHttpError(msg, response.status)
+
+        summary = response.getheader("X-ClickHouse-Summary", "")
+        self.logs.info(f"Insert into {table} success. {summary}")
+
+        return summary
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        with self.lock:
+            for connection in self.pool:
+                connection.close()
+
+            self.pool.clear()
@@ -15,17 +15,29 @@ from pandas import DataFrame as PdFrame
 from polars import DataFrame as PlFrame
 
 from .compress import NativeCompressFile
+from .streams import (
+    ForwardCursor,
+    StreamMethod,
+    StreamReader,
+)
 
 
 FORMAT_VALUES: Dict[type, int] = {
     BufferedIOBase: 0,
     BufferedReader: 0,
     BufferedWriter: 0,
+    ForwardCursor: 0,
     GzipFile: 1,
+    StreamReader: 1,
     PdFrame: 2,
     PlFrame: 3,
     NativeCompressFile: 4,
 }
+STREAM_VALUES: Dict[StreamMethod, int] = {
+    StreamMethod.GZIP: 1,
+    StreamMethod.ZSTD: 5,
+    StreamMethod.LZ4: 6,
+}
 
 class DataFormat(Enum):
     """Format of processed data.."""
@@ -35,6 +47,8 @@ class DataFormat(Enum):
     Pandas = 2
     Polars = 3
     CompressedNative = 4
+    ZstdNative = 5
+    LZ4Native = 6
 
 
 class DataInfo(NamedTuple):
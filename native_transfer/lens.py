@@ -1,5 +1,8 @@
 from io import BufferedIOBase
-from struct import unpack
+from struct import (
+    error as EOF,
+    unpack,
+)
 from typing import Optional
 
 from .errors import (
@@ -27,6 +30,18 @@ def read_lens(file: BufferedIOBase) -> int:
     raise NativeReadError("Invalid UInt value!")
 
 
+def read_exact(file: BufferedIOBase, size: int) -> bytes:
+    """Read size bytes, a short read raises struct.error like unpack."""
+
+    data = file.read(size)
+
+    if len(data) < size:
+        msg = f"Expected {size} bytes, got {len(data)}"
+        raise EOF(msg)
+
+    return data
+
+
 def write_lens(lens: int, file: Optional[BufferedIOBase] = None) -> bytes:
     """Encoding length into ClickHouse Native Format
     (number of columns, number of rows, length of row)."""
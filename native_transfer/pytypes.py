@@ -1,4 +1,5 @@
 from enum import Enum
+from itertools import chain
 from datetime import (
     date,
     datetime,
@@ -8,31 +9,66 @@ from ipaddress import (
     IPv4Address,
     IPv6Address,
 )
+from re import (
+    Pattern,
+    compile,
+)
 from typing import (
     Any,
     Dict,
     List,
+    Optional,
     Tuple,
+    Type,
     Union,
 )
 from uuid import UUID
 
-from numpy import generic
+from numpy import ndarray
 from pandas import (
+    CategoricalDtype,
     DataFrame as PdFrame,
+    Series as PdSeries,
+    StringDtype,
     Timestamp,
+    isna,
 )
+from pandas.api.types import infer_dtype
 from polars import (
+    Array as PlArray,
+    Boolean,
+    Categorical,
+    DataType,
+    Date,
+    Datetime,
+    Enum as PlEnum,
+    Expr,
+    Float64,
+    List as PlList,
+    Null,
+    String,
     col,
-    max,
-    min,
     DataFrame as PlFrame,
+    LazyFrame as PlLazyFrame,
 )
-from polars.exceptions import InvalidOperationError
 
+from .dtypes.integers import INTEGER_LENS
 from .errors import dtype_error
 
 
+# Count of values to determine data type of object columns
+SAMPLE_ROWS: int = 1_000
+FIXED_STRING_PATTERN: Pattern = compile(r"FixedString\(\d+\)")
+
+
+class SampleStrategy(Enum):
+    """Sampling of pandas object columns for data type inference."""
+
+    Head = 0
+    Random = 1
+    Full = 2
+
+
 PYTYPES: Dict[Tuple[type, int], str] = {
     (str, 0): "String",
     (str, 1): "FixedString",
@@ -102,6 +138,67 @@ TZONES: Dict[str, str] = {
 }
 
 
+def int_dtype(min_val: int, max_val: int) -> str:
+    """Smallest integer data type for values range."""
+
+    if 0 <= min_val:
+        for val in range(6):
+            raw_string: str = PYTYPES[(int, val)]
+            if max_val < 1 << (INTEGER_LENS[raw_string] * 8):
+                return raw_string
+    else:
+        for val in range(6, 12):
+            raw_string: str = PYTYPES[(int, val)]
+            bits: int = INTEGER_LENS[raw_string] * 8 - 1
+            if -(1 << bits) <= min_val and max_val < 1 << bits:
+                return raw_string
+
+    return PYTYPES[(int, 11)]
+
+
+def date_dtype(min_val: date, max_val: date) -> str:
+    """Date or Date32 for values range."""
+
+    if date(1970, 1, 1) <= min_val and max_val <= date(2149, 6, 6):
+        return PYTYPES[(date, 0)]
+
+    return PYTYPES[(date, 1)]
+
+
+def datetime_dtype(
+    min_val: datetime,
+    max_val: datetime,
+    zone: Optional[str] = None,
+) -> str:
+    """DateTime or DateTime64 for values range."""
+
+    if min_val.tzinfo is None:
+        min_val = min_val.replace(tzinfo=timezone.utc)
+    if max_val.tzinfo is None:
+        max_val = max_val.replace(tzinfo=timezone.utc)
+
+    if datetime(1970, 1, 1, tzinfo=timezone.utc) <= min_val and (
+        max_val <= datetime(2106, 2, 7, 6, 28, 15, tzinfo=timezone.utc)
+    ):
+        return PYTYPES[(datetime, 0)]
+
+    if not zone:
+        zone = TZONES.get(max_val.strftime("%z"), "UTC")
+
+    return f"{PYTYPES[(datetime, 1)]}(3, '{zone}')"
+
+
+def enum_dtype(enum: Type[Enum]) -> str:
+    """Enum8 or Enum16 for python Enum class."""
+
+    values: str = ", ".join(f"'{i.name}' = {i.value}" for i in enum)
+
+    if all(-128 <= i.value <= 127 for i in enum):
+        return f"Enum8({values})"
+
+    return f"Enum16({values})"
+
+
 def make_dtype(
     min_val: Any,
     max_val: Any,
@@ -112,14 +209,9 @@ def make_dtype(
     if is_nullable:
         return f"Nullable({make_dtype(min_val, max_val, is_fixed, False)})"
     elif isinstance(max_val, Enum):
-        values: str = ", ".join(
-            f"'{i.name}' = {i.value}" for i in max_val.__class__
-        )
-        if -128 <= min_val and max_val <= 127:
-            return f"Enum8({values})"
-        return f"Enum16({values})"
+        return enum_dtype(max_val.__class__)
     elif isinstance(max_val, str) and is_fixed:
-        return f"{PYTYPES[(str, is_fixed)]}({len(max_val)})"
+        return f"{PYTYPES[(str, is_fixed)]}({len(max_val.encode())})"
     elif isinstance(max_val, float):
         if (
             1.401298464324817e-45 <= min_val
@@ -128,52 +220,13 @@ def make_dtype(
             return PYTYPES[(float, 0)]
         return PYTYPES[(float, 1)]
     elif isinstance(max_val, datetime):
-        if datetime(1970, 1, 1, tzinfo=timezone.utc) <= min_val.astimezone(
-            timezone.utc
-        ) and max_val.astimezone(timezone.utc) <= datetime(
-            2106, 2, 7, 6, 28, 15, tzinfo=timezone.utc
-        ):
-            return PYTYPES[(datetime, 0)]
-        zone: str = TZONES.get(max_val.strftime("%z"), "UTC")
-        return f"{PYTYPES[(datetime, 1)]}(3, '{zone}')"
+        return datetime_dtype(min_val, max_val)
     elif isinstance(max_val, date):
-        if date(1970, 1, 1) <= min_val and max_val <= date(2149, 6, 6):
-            return PYTYPES[(date, 0)]
-        return PYTYPES[(date, 1)]
+        return date_dtype(min_val, max_val)
+    elif isinstance(max_val, bool):
+        return PYTYPES[(bool, 0)]
     elif isinstance(max_val, int):
-        if 0 <= min_val:
-            if max_val <= 255:
-                val = 0
-            elif max_val <= 65535:
-                val = 1
-            elif max_val <= 4294967295:
-                val = 2
-            elif max_val <= 18446744073709551615:
-                val = 3
-            elif max_val <= 340282366920938463463374607431768211455:
-                val = 4
-            else:
-                val = 5
-        else:
-            if -128 <= min_val and 127 <= max_val:
-                val = 6
-            if -32768 <= min_val and 32767 <= max_val:
-                val = 7
-            if -2147483648 <= min_val and 2147483647 <= max_val:
-                val = 8
-            if (
-                -9223372036854775808 <= min_val
-                and 9223372036854775807 <= max_val
-            ):
-                val = 9
-            if (
-                -170141183460469231731687303715884105728 <= min_val
-                and 170141183460469231731687303715884105727 <= max_val
-            ):
-                val = 10
-            else:
-                val = 11
-        return PYTYPES[(type(max_val), val)]
+        return int_dtype(min_val, max_val)
 
     raw_string = PYTYPES.get((type(max_val), is_fixed))
 
@@ -183,119 +236,273 @@ def make_dtype(
     return raw_string
 
 
-def dtype_from_polars(frame: PlFrame) -> List[str]:
-    """Auto determine ClickHouse data types for polars.DataFrame"""
+def polars_leaf(
+    column: str,
+    dtype: DataType,
+) -> Tuple[Expr, DataType, int]:
+    """Unwrap List/Array column to its items expression."""
 
-    columns: List[str] = frame.columns
-    dtypes: List[str] = []
+    expr: Expr = col(column)
+    depth: int = 0
 
-    for column in columns:
-        is_nullable: bool = frame.select(col(column).is_null().any()).item()
-        is_fixed: bool = False
-        min_val: Any
-        max_val: Any
-
-        try:
-            min_val = frame.select(min(column)).item()
-            max_val = frame.select(max(column)).item()
-        except InvalidOperationError:
-            try:
-                min_val, *_, max_val = frame[column].drop_nulls().to_list()
-            except ValueError:
-                try:
-                    min_val = max_val = frame[column].drop_nulls().to_list()[0]
-                except ValueError:
-                    min_val = max_val = None
-                    is_nullable = True
-
-        if isinstance(
-            min_val,
-            str,
-        ) and len(min_val) == len(max_val) and len(min_val) > 0:
-            is_fixed: bool = (
-                frame.filter(col(column).is_not_null())
-                .select((col(column).str.len_chars() == len(max_val)).all())
-                .item()
-            )
+    while isinstance(dtype, (PlList, PlArray)):
+        expr = expr.explode(empty_as_null=False, keep_nulls=False)
+        dtype = dtype.inner
+        depth += 1
 
-        if isinstance(min_val, list) or isinstance(max_val, list):
-            values: List[Any] = sum(frame[column].to_list(), [])
-            is_nullable = None in values
-            min_val, *_, max_val = sorted(
-                value for value in values if value is not None
+    return expr, dtype, depth
+
+
+def polars_aggregates(num: int, expr: Expr, dtype: DataType) -> List[Expr]:
+    """Aggregate expressions required to determine data type."""
+
+    aggregates: List[Expr] = [expr.null_count().alias(f"{num}_nulls")]
+
+    if dtype in (Date, Datetime):
+        aggregates.extend(
+            (
+                expr.min().alias(f"{num}_min"),
+                expr.max().alias(f"{num}_max"),
             )
-            del values
-            dtypes.append(
-                f"Array({make_dtype(min_val, max_val, is_fixed, is_nullable)})"
+        )
+    elif dtype == String:
+        lens: Expr = expr.str.len_bytes()
+        aggregates.extend(
+            (
+                lens.min().alias(f"{num}_min"),
+                lens.max().alias(f"{num}_max"),
             )
-            continue
+        )
 
-        dtypes.append(make_dtype(min_val, max_val, is_fixed, is_nullable))
+    return aggregates
 
-    return dtypes
 
+def polars_dtype(
+    num: int,
+    dtype: DataType,
+    stats: Dict[str, Any],
+    items: PlLazyFrame,
+) -> str:
+    """Determine data type by polars dtype and column aggregates."""
+
+    min_val: Any = stats.get(f"{num}_min")
+    max_val: Any = stats.get(f"{num}_max")
+
+    if dtype == Boolean:
+        return PYTYPES[(bool, 0)]
+    elif dtype.is_integer():
+        return str(dtype)
+    elif dtype.is_float():
+        return PYTYPES[(float, int(dtype == Float64))]
+    elif dtype == String:
+        if min_val and min_val == max_val:
+            return f"{PYTYPES[(str, 1)]}({max_val})"
+        return PYTYPES[(str, 0)]
+    elif dtype in (Categorical, PlEnum):
+        return PYTYPES[(str, 0)]
+    elif dtype == Date:
+        if min_val is None:
+            return PYTYPES[(date, 0)]
+        return date_dtype(min_val, max_val)
+    elif dtype == Datetime:
+        if min_val is None:
+            return PYTYPES[(datetime, 0)]
+        return datetime_dtype(min_val, max_val, dtype.time_zone)
+    elif dtype == Null:
+        return "Nothing"
 
-def dtype_from_pandas(frame: PdFrame) -> List[str]:
-    """Auto determine ClickHouse data types for pandas.DataFrame."""
+    value: Any = next(
+        iter(items.drop_nulls().head(1).collect().to_series()),
+        None,
+    )
 
-    columns: List[str] = list(frame.columns)
+    return make_dtype(value, value, False, False)
+
+
+def dtype_from_polars(frame: PlFrame, *_: Any) -> List[str]:
+    """Auto determine ClickHouse data types for polars.DataFrame"""
+
+    if not frame.width:
+        return []
+
+    leafs: List[Tuple[Expr, DataType, int]] = [
+        polars_leaf(column, dtype) for column, dtype in frame.schema.items()
+    ]
+    stats: Dict[str, Any] = frame.select(
+        [
+            aggregate
+            for num, (expr, dtype, _) in enumerate(leafs)
+            for aggregate in polars_aggregates(num, expr, dtype)
+        ]
+    ).row(0, named=True)
     dtypes: List[str] = []
 
-    for column in columns:
-        is_nullable: bool = frame[column].isnull().all()
-        is_fixed: bool = False
-        min_val: Any
-        max_val: Any
-
-        try:
-            min_val = frame[column].dropna().min()
-            max_val = frame[column].dropna().max()
-        except (TypeError, ValueError):
-            try:
-                min_val, *_, max_val = frame[column].dropna().to_list()
-            except ValueError:
-                try:
-                    min_val = max_val = frame[column].dropna().to_list()[0]
-                except ValueError:
-                    min_val = max_val = None
-                    is_nullable = True
-
-        if isinstance(
-            min_val,
-            str,
-        ) and len(min_val) == len(max_val) and len(min_val) > 0:
-            is_fixed: bool = (frame[column].str.len() == len(max_val)).all()
-        elif isinstance(min_val, Timestamp) or isinstance(max_val, Timestamp):
-            min_val = min_val.to_pydatetime()
-            max_val = max_val.to_pydatetime()
-        elif isinstance(min_val, generic) or isinstance(max_val, generic):
-            min_val = min_val.item()
-            max_val = max_val.item()
-
-        if isinstance(min_val, list) or isinstance(max_val, list):
-            values: List[Any] = sum(frame[column].dropna().to_list(), [])
-            is_nullable = None in values
-            min_val, *_, max_val = sorted(
-                value for value in values if value is not None
-            )
-            del values
-            dtypes.append(
-                f"Array({make_dtype(min_val, max_val, is_fixed, is_nullable)})"
-            )
-            continue
+    for num, (expr, dtype, depth) in enumerate(leafs):
+        raw_string: str = polars_dtype(
+            num, dtype, stats, frame.lazy().select(expr)
+        )
+
+        if stats[f"{num}_nulls"]:
+            raw_string = f"Nullable({raw_string})"
 
-        dtypes.append(make_dtype(min_val, max_val, is_fixed, is_nullable))
+        dtypes.append(f"{'Array(' * depth}{raw_string}{')' * depth}")
 
     return dtypes
 
 
+def sample_values(
+    series: PdSeries,
+    sample_rows: int,
+    sample_strategy: SampleStrategy,
+) -> PdSeries:
+    """Bounded sample of not null values from pandas.Series."""
+
+    if sample_strategy == SampleStrategy.Full or len(series) <= sample_rows:
+        return series.dropna()
+
+    if sample_strategy == SampleStrategy.Random:
+        sample: PdSeries = series.sample(sample_rows, random_state=0).dropna()
+    else:
+        sample: PdSeries = series.head(sample_rows).dropna()
+
+    if sample.empty:
+        return series.dropna().head(sample_rows)
+
+    return sample
+
+
+def string_dtype(series: PdSeries, sample: PdSeries) -> str:
+    """String or FixedString(N) for pandas.Series with strings.
+
+    The sample only rules FixedString out. Confirming it needs every value,
+    since one longer string would be rejected by FixedString on write."""
+
+    lens: PdSeries = sample.str.len()
+
+    if lens.empty or lens.min() != lens.max() or lens.min() == 0:
+        return PYTYPES[(str, 0)]
+
+    values: PdSeries = series.dropna()
+    lens = values.str.len()
+
+    if lens.min() == lens.max() and values.str.isascii().all():
+        return f"{PYTYPES[(str, 1)]}({lens.max()})"
+
+    return PYTYPES[(str, 0)]
+
+
+def pandas_dtype(
+    series: PdSeries,
+    sample_rows: int,
+    sample_strategy: SampleStrategy,
+) -> str:
+    """Determine data type by pandas dtype or sample of values."""
+
+    dtype: Any = series.dtype
+
+    if isinstance(dtype, CategoricalDtype):
+        return pandas_dtype(
+            PdSeries(dtype.categories), sample_rows, sample_strategy
+        )
+    elif dtype.kind == "b":
+        return PYTYPES[(bool, 0)]
+    elif dtype.kind in "iu":
+        return f"{'U' * (dtype.kind == 'u')}Int{dtype.itemsize * 8}"
+    elif dtype.kind == "f":
+        return PYTYPES[(float, int(dtype.itemsize > 4))]
+    elif dtype.kind == "M":
+        min_val: Timestamp = series.min()
+        max_val: Timestamp = series.max()
+
+        if isna(min_val):
+            return PYTYPES[(datetime, 0)]
+
+        tzinfo: Any = getattr(dtype, "tz", None)
+        zone: Optional[str] = str(tzinfo) if tzinfo else None
+
+        return datetime_dtype(
+            min_val.to_pydatetime(), max_val.to_pydatetime(), zone
+        )
+
+    sample: PdSeries = sample_values(series, sample_rows, sample_strategy)
+
+    if isinstance(dtype, StringDtype):
+        return string_dtype(series, sample)
+
+    kind: str = infer_dtype(sample, skipna=True)
+
+    if kind == "empty":
+        return "Nothing"
+    elif kind == "string":
+        return string_dtype(series, sample)
+    elif kind == "boolean":
+        return PYTYPES[(bool, 0)]
+    elif kind in ("floating", "mixed-integer-float"):
+        return PYTYPES[(float, 1)]
+    elif kind in ("integer", "date", "datetime"):
+        values: PdSeries = series.dropna()
+        return make_dtype(values.min(), values.max(), False, False)
+
+    value: Any = sample.iloc[0]
+
+    if isinstance(value, (list, tuple, ndarray)):
+        items = PdSeries(
+            list(chain.from_iterable(series.dropna())),
+            dtype=object,
+        )
+        return f"Array({pandas_column(items, sample_rows, sample_strategy)})"
+
+    return make_dtype(value, value, False, False)
+
+
+def pandas_column(
+    series: PdSeries,
+    sample_rows: int,
+    sample_strategy: SampleStrategy,
+) -> str:
+    """Determine data type with Nullable for pandas.Series."""
+
+    raw_string: str = pandas_dtype(series, sample_rows, sample_strategy)
+
+    if raw_string[:6] != "Array(" and series.hasnans:
+        return f"Nullable({raw_string})"
+
+    return raw_string
+
+
+def dtype_from_pandas(
+    frame: PdFrame,
+    sample_rows: int = SAMPLE_ROWS,
+    sample_strategy: SampleStrategy = SampleStrategy.Head,
+) -> List[str]:
+    """Auto determine ClickHouse data types for pandas.DataFrame."""
+
+    return [
+        pandas_column(frame[column], sample_rows, sample_strategy)
+        for column in frame.columns
+    ]
+
+
 SELECT_FRAME: Dict[type, object] = {
     PdFrame: dtype_from_pandas,
     PlFrame: dtype_from_polars,
 }
 
 
-def dtype_from_frame(frame: Union[PdFrame, PlFrame]) -> List[str]:
+def stream_dtype(raw_string: str) -> str:
+    """Data type for every DataFrame of an iterator, string lengths
+    of the next DataFrames are unknown, so FixedString(N) is String."""
+
+    return FIXED_STRING_PATTERN.sub(PYTYPES[(str, 0)], raw_string)
+
+
+def dtype_from_frame(
+    frame: Union[PdFrame, PlFrame],
+    sample_rows: int = SAMPLE_ROWS,
+    sample_strategy: SampleStrategy = SampleStrategy.Head,
+) -> List[str]:
     """Auto determine ClickHouse data types."""
 
-    return SELECT_FRAME.get(frame.__class__, dtype_error)(frame)
+    return SELECT_FRAME.get(frame.__class__, dtype_error)(
+        frame, sample_rows, sample_strategy
+    )
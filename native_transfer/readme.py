@@ -168,6 +168,22 @@ Optional parameters during initialization:
 * block_rows - the maximum number of rows in one block when packing
 a DataFrame into Native. Range [1:1048576]. Default is 65400.
 * logs - an instance of the logging.Logger class.
+* compress_dictionary - path to a trained ZSTD dictionary
+(see CompressCodec.train_dictionary and CompressCodec.save_dictionary).
+Files compressed with a dictionary can only be read with the same
+dictionary and are not readable by Clickhouse. Default is None.
+* compress_cache_blocks - number of decompressed blocks of a compressed
+Native file kept in the LRU cache, so seek() back and forth decompresses
+only the block holding the target position once. 0 disables the cache.
+Default is 4.
+* checksum_policy - ChecksumPolicy object, how CityHash128 checksums
+of compressed blocks are checked: Verify (raise NativeCompressHashError
+on mismatch), Lazy (check in a background thread and log mismatches)
+or Skip. Default is ChecksumPolicy.Verify.
+* sample_rows - the number of values checked to determine the data type
+of object columns of pandas.DataFrame. Default is 1000.
+* sample_strategy - SampleStrategy object, how to take values
+for sample_rows: Head, Random or Full. Default is SampleStrategy.Head.
 
 Static Methods of the Class and Their Parameters:
 
@@ -175,10 +191,28 @@ open
 * file - Native file. You can specify the path to the file, pass bytes,
 an open file, a file-like object, or GzipFile.
 * mode - file operation mode. Reading "rb", writing "wb". Default is "rb".
-* write_compressed - boolean, compress the file when creating
-Native from DataFrame - True, no - False. Default is False.
-
-Returns an object of type io.BufferedIOBase | gzip.GzipFile.
+* write_compressed - compress the file when creating Native
+from DataFrame: True (gzip), StreamMethod.GZIP, StreamMethod.ZSTD
+or StreamMethod.LZ4 (LZ4 frame), no - False. Default is False.
+* compress_level - compression level for write_compressed.
+Default is None (9 for gzip, 3 for zstd, 0 for LZ4).
+* workers - number of threads compressing independent members/frames
+when write_compressed is set. Default is 1.
+* gzip_index - True or GzipIndex object, seek points for random access
+into a gzip file. With True the index is loaded from the <file>.gzidx
+sidecar or built with one pass and saved next to the file.
+Default is False.
+
+Returns an object of type io.BufferedIOBase | StreamReader | StreamWriter.
+Gzip, zstd and LZ4 frame files are detected by magic bytes
+and read by StreamReader with large reads.
+Not seekable inputs (pipes, sockets, sys.stdin.buffer) are wrapped
+in ForwardCursor, a buffered forward-only cursor: magic bytes
+and the first compressed block are checked with bounded lookahead
+and skipping is done by reading, so
+clickhouse-client ... --format Native | python tool.py
+works without temporary files. Such input can be read only once:
+info and extract need separate streams.
 
 info
 * file - data object
@@ -189,7 +223,8 @@ Returns an object of type DataInfo.
 Main Methods of the Class and Their Parameters:
 
 make
-* frame - input data DataFrame pandas.DataFrame | polars.DataFrame.
+* frame - input data DataFrame pandas.DataFrame | polars.DataFrame
+or iterator of DataFrames.
 * file - file object for writing io.BufferedIOBase | gzip.GzipFile.
 * columns - [optional] list of column names if you need to change some names
 without altering the DataFrame.
@@ -200,6 +235,19 @@ If empty, data types will be determined automatically.
 As a result, a Native file will be created from the DataFrame;
 the method does not return anything additionally.
 
+make_stream
+* batches - iterable of pandas.DataFrame | polars.DataFrame,
+polars.LazyFrame (read with collect_batches) or pyarrow.RecordBatchReader
+and other iterables of Arrow record batches.
+* file - file object for writing io.BufferedIOBase | gzip.GzipFile.
+* columns - [optional] list of column names.
+* dtypes - [optional] list of data types for the columns.
+If empty, data types are determined from the first batch.
+
+Every batch is written as Native blocks as soon as it is produced,
+so unbounded datasets are written with flat memory. All batches must have
+the columns of the first batch, otherwise NativeWriteError is raised.
+
 extract_block
 * file - file object for reading io.BufferedIOBase | gzip.GzipFile.
 * frame_type - an object of the FrameType class to determine the output format.
@@ -216,6 +264,69 @@ Default is FrameType.Pandas.
 As a result, an object of type pandas.DataFrame | polars.DataFrame
 will be returned, containing the entire Native file.
 
+iter_blocks
+* chunks - iterator of bytes, for example the body
+of a SELECT ... FORMAT Native HTTP response.
+* frame_type - an object of the FrameType class to determine the output format.
+Default is FrameType.Pandas.
+* compressed - boolean, the stream consists of Clickhouse compressed blocks
+(compress=1), they are decompressed with the codec of the class.
+Default is False.
+* content_encoding - StreamMethod object for gzip, zstd or LZ4 frame
+HTTP compression of the stream. Default is None.
+
+Generator of pandas.DataFrame | polars.DataFrame, every Native block
+is returned as soon as its bytes have arrived. The stream is never seeked.
+
+insert
+* frame - pandas.DataFrame | polars.DataFrame or iterator of DataFrames.
+* client - HttpInsert object.
+* table - Clickhouse table name.
+* columns - [optional] list of column names.
+* dtypes - [optional] list of data types for the columns.
+
+Native blocks are made one by one and sent as chunked transfer encoding,
+so the payload is never kept in memory entirely.
+Returns the X-ClickHouse-Summary header.
+
+insert_parallel
+* frame - pandas.DataFrame | polars.DataFrame or iterator of DataFrames.
+* client - HttpInsert object.
+* table - Clickhouse table name.
+* shards - number of shards of a DataFrame and of requests sent at once.
+Default is 4.
+* retries - number of repeated attempts for a failed shard. Default is 2.
+* columns - [optional] list of column names.
+* dtypes - [optional] list of data types for the columns.
+
+A DataFrame is split into shards of whole Native blocks,
+every DataFrame of an iterator is one shard. Shards are encoded and sent
+in parallel threads over the connection pool of HttpInsert,
+a failed shard is encoded and sent again. Returns InsertReport with rows,
+bytes, time, retries and throughput. Repeated attempts may duplicate rows
+of a shard that Clickhouse has received but not confirmed.
+
+aiter_blocks
+* reader - asyncio.StreamReader-like object with the coroutine read(n).
+* frame_type - an object of the FrameType class to determine the output format.
+Default is FrameType.Pandas.
+
+Asynchronous generator async for frame in nt.aiter_blocks(reader),
+yields pandas.DataFrame | polars.DataFrame for every Native block.
+Gzip, zstd and LZ4 frame streams are detected by magic bytes and compressed
+Native by a valid first block, as in open and info.
+Blocks are decoded in the executor as bytes arrive.
+
+amake
+* frame - input data DataFrame pandas.DataFrame | polars.DataFrame.
+* writer - asyncio.StreamWriter-like object with write(data)
+and the coroutine drain(). write may also be a coroutine.
+* columns - [optional] list of column names.
+* dtypes - [optional] list of data types for the columns.
+
+Coroutine await nt.amake(frame, writer), blocks are encoded
+in the executor and sent as they are ready. The writer is not closed.
+
 Errors returned by NativeFormat class:
 
 * NativeError - Base error
@@ -236,7 +347,10 @@ Possible values:
 + Native = 0,
 + GzipNative = 1,
 + Pandas = 2,
-+ Polars = 3
++ Polars = 3,
++ CompressedNative = 4,
++ ZstdNative = 5,
++ LZ4Native = 6
 
 * DataInfo - NamedTuple with an assigned string representation.
 
@@ -251,4 +365,50 @@ Class attributes:
 Possible values:
 + Pandas = 0,
 + Polars = 1
+
+Additional functions:
+
+recompress
+* src - compressed Native file for reading.
+* dst - file for writing the re-encoded blocks.
+* method - CompressionMethod object for the new blocks.
+Default is CompressionMethod.LZ4.
+* level - compression level. Default is 0.
+For LZ4, level 1-12 packs blocks with LZ4HC.
+* workers - number of threads for reading and packing blocks. Default is 1.
+* frame_size - size of new uncompressed blocks in bytes.
+Default is None, the source blocks are kept.
+* codec - CompressCodec object with a ZSTD dictionary or codec_chain.
+Default is None.
+* logs - an instance of the logging.Logger class.
+Reads, re-encodes and writes the file block by block,
+so the file is never loaded into memory entirely.
+
+GzipIndex.from_file
+* file - gzip file opened for reading.
+* span - decompressed bytes between seek points. Default is 8388608.
+Builds the index with one pass over the file. Seek points are gzip
+member starts (files written with write_compressed and workers)
+and sync flush markers with the last 32 KiB of decompressed data.
+A single-member gzip file without flush markers has one seek point only.
+The index is saved with GzipIndex.save(path)
+and loaded with GzipIndex.load(path).
+
+HttpInsert
+* url - Clickhouse HTTP interface address.
+Default is "http://localhost:8123".
+* user - user name. Default is "default".
+* password - user password. Default is "".
+* database - database name. Default is "default".
+* content_encoding - StreamMethod object to compress the request body
+(gzip, zstd or lz4 Content-Encoding). Default is None.
+* compress_level - compression level for content_encoding.
+Default is None.
+* settings - dictionary of Clickhouse settings passed
+as query parameters. Default is None.
+* timeout - seconds to wait for the answer. Default is 600.
+* logs - an instance of the logging.Logger class.
+Keeps a pool of keep-alive connections, the method insert(table, blocks)
+posts an iterator of Native blocks, close() closes the pool.
+Raises NativeWriteError if Clickhouse answers with an error.
 """
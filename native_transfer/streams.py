@@ -0,0 +1,662 @@
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from enum import Enum
+from gzip import compress as gzip_compress
+from io import (
+    BufferedIOBase,
+    BufferedReader,
+    RawIOBase,
+    UnsupportedOperation,
+)
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from zlib import (
+    DEFLATED,
+    compressobj,
+    decompressobj,
+)
+
+from lz4.frame import (
+    LZ4FrameCompressor,
+    LZ4FrameDecompressor,
+    compress as lz4_compress,
+)
+from zstandard import (
+    ZstdCompressor,
+    ZstdDecompressor,
+)
+
+from .compress import BLOCK_SIZE
+from .compress.zstd_func import zstd_compressor
+from .gzip_index import (
+    GZIP_WBITS,
+    READ_SIZE,
+    TRAILER_SIZE,
+    GzipIndex,
+    SeekPoint,
+)
+
+
+# decompressed bytes returned by one decompress call
+CHUNK_SIZE = 4194304
+# compressed bytes fed to zstd at once: a block of 4 bytes or more
+# unpacks to 128 KiB at most, so one slice gives 64 MiB at most
+ZSTD_SLICE = 2048
+# max bytes looked ahead to check the first compressed block
+LOOKAHEAD_SIZE = 16777216
+
+
+class StreamMethod(Enum):
+    """Compression of the whole Native file, values are magic bytes."""
+
+    GZIP = b"\x1f\x8b"
+    ZSTD = b"\x28\xb5\x2f\xfd"
+    LZ4 = b"\x04\x22\x4d\x18"
+
+
+def gzip_decompressor() -> Any:
+    """Decompressor of gzip members."""
+
+    return decompressobj(GZIP_WBITS)
+
+
+def zstd_decompressor() -> Any:
+    """Decompressor of zstd frames."""
+
+    return ZstdDecompressor().decompressobj()
+
+
+def zstd_frame(data: bytes, level: int) -> bytes:
+    """Pack data into one zstd frame."""
+
+    return zstd_compressor(level).compress(data)
+
+
+def lz4_frame(data: bytes, level: int) -> bytes:
+    """Pack data into one LZ4 frame."""
+
+    return lz4_compress(data, compression_level=level)
+
+
+def gzip_encoder(level: int) -> Tuple[Any, bytes]:
+    """Incremental compressor of one gzip member."""
+
+    return compressobj(level, DEFLATED, GZIP_WBITS), b""
+
+
+def zstd_encoder(level: int) -> Tuple[Any, bytes]:
+    """Incremental compressor of one zstd frame."""
+
+    return ZstdCompressor(level=level).compressobj(), b""
+
+
+def lz4_encoder(level: int) -> Tuple[Any, bytes]:
+    """Incremental compressor of one LZ4 frame and its header."""
+
+    compressor = LZ4FrameCompressor(compression_level=level)
+
+    return compressor, compressor.begin()
+
+
+STREAM_DECOMPRESSORS: Dict[StreamMethod, Callable[[], Any]] = {
+    StreamMethod.GZIP: gzip_decompressor,
+    StreamMethod.ZSTD: zstd_decompressor,
+    StreamMethod.LZ4: LZ4FrameDecompressor,
+}
+STREAM_COMPRESSORS: Dict[StreamMethod, Callable[[bytes, int], bytes]] = {
+    StreamMethod.GZIP: gzip_compress,
+    StreamMethod.ZSTD: zstd_frame,
+    StreamMethod.LZ4: lz4_frame,
+}
+STREAM_ENCODERS: Dict[StreamMethod, Callable[[int], Tuple[Any, bytes]]] = {
+    StreamMethod.GZIP: gzip_encoder,
+    StreamMethod.ZSTD: zstd_encoder,
+    StreamMethod.LZ4: lz4_encoder,
+}
+# gzip.GzipFile, zstd and lz4 command line defaults
+STREAM_LEVELS: Dict[StreamMethod, int] = {
+    StreamMethod.GZIP: 9,
+    StreamMethod.ZSTD: 3,
+    StreamMethod.LZ4: 0,
+}
+
+
+def detect_stream(magic: bytes) -> Optional[StreamMethod]:
+    """Stream compression by the first bytes of the file."""
+
+    for method in StreamMethod:
+        if magic.startswith(method.value):
+            return method
+
+
+class StreamEncoder:
+    """Incremental compressor of gzip, zstd or LZ4 frame stream."""
+
+    def __init__(
+        self,
+        method: StreamMethod = StreamMethod.GZIP,
+        level: Optional[int] = None,
+    ) -> None:
+        """Class initialization."""
+
+        self.method = method
+        self.level = STREAM_LEVELS[method] if level is None else level
+        self.compressor, self.header = STREAM_ENCODERS[method](self.level)
+
+    def compress(self, data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Compress the next part of the stream."""
+
+        header, self.header = self.header, b""
+
+        return header + self.compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Finish the stream."""
+
+        header, self.header = self.header, b""
+
+        return header + self.compressor.flush()
+
+
+def decompress_chunks(
+    chunks: Iterable[bytes],
+    method: StreamMethod,
+) -> Generator[bytes, None, None]:
+    """Decompress gzip, zstd or LZ4 frame stream given by chunks."""
+
+    decompressor = STREAM_DECOMPRESSORS[method]()
+
+    for chunk in chunks:
+        while chunk:
+            if decompressor.eof:
+                decompressor = STREAM_DECOMPRESSORS[method]()
+
+            yield decompressor.decompress(chunk)
+            chunk = decompressor.unused_data if decompressor.eof else b""
+
+
+def file_chunks(
+    file: BufferedIOBase,
+    size: int = READ_SIZE,
+) -> Generator[bytes, None, None]:
+    """Chunks of pipe, socket or stdin as they arrive."""
+
+    read = getattr(file, "read1", file.read)
+
+    while chunk := read(size):
+        yield chunk
+
+
+class ChunkReader(RawIOBase):
+    """Forward-only file over iterator of byte chunks,
+    forward seek skips bytes by reading."""
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        name: str = "stream",
+    ) -> None:
+        """Class initialization."""
+
+        self.chunks = iter(chunks)
+        self.name = name
+        self.data = b""
+        self.offset = 0
+        self.position = 0
+
+    def readable(self) -> bool:
+        """Check readable."""
+
+        return True
+
+    def seekable(self) -> bool:
+        """Forward seek only."""
+
+        return True
+
+    def tell(self) -> int:
+        """Count of bytes read."""
+
+        return self.position
+
+    def next_chunk(self) -> bool:
+        """Take the next chunk, False at the end of the stream."""
+
+        data = next(self.chunks, None)
+
+        if data is None:
+            return False
+
+        self.data = data
+        self.offset = 0
+
+        return True
+
+    def peek(self, size: int) -> bytes:
+        """Up to size next bytes without moving the cursor."""
+
+        while len(self.data) - self.offset < size:
+            data = next(self.chunks, None)
+
+            if data is None:
+                break
+
+            self.data = bytes(self.data[self.offset:]) + data
+            self.offset = 0
+
+        return bytes(self.data[self.offset:self.offset + size])
+
+    def readinto(self, buffer: memoryview) -> int:
+        """Read the next bytes of the current chunk into buffer."""
+
+        while self.offset >= len(self.data):
+            if not self.next_chunk():
+                return 0
+
+        size = min(len(buffer), len(self.data) - self.offset)
+        buffer[:size] = memoryview(self.data)[self.offset:self.offset + size]
+        self.offset += size
+        self.position += size
+
+        return size
+
+    def seek(
+        self,
+        position: int,
+        whence: int = 0,
+    ) -> int:
+        """Seek forward by reading."""
+
+        if whence == 1:
+            position += self.position
+        elif whence == 2:
+            raise UnsupportedOperation("Seek from end not supported")
+
+        if position < self.position:
+            raise UnsupportedOperation(
+                "Backward seek on forward-only stream"
+            )
+
+        while self.position < position:
+            if self.offset >= len(self.data) and not self.next_chunk():
+                break
+
+            step = min(position - self.position, len(self.data) - self.offset)
+            self.offset += step
+            self.position += step
+
+        return self.position
+
+
+class ForwardCursor(BufferedReader):
+    """Buffered forward-only cursor over pipe, socket, stdin
+    or iterator of byte chunks with bounded lookahead."""
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        name: str = "stream",
+        buffer_size: int = READ_SIZE,
+    ) -> None:
+        """Class initialization."""
+
+        super().__init__(ChunkReader(chunks, name), buffer_size)
+
+    @classmethod
+    def from_file(cls, file: BufferedIOBase) -> "ForwardCursor":
+        """Cursor over not seekable file."""
+
+        return cls(file_chunks(file), str(getattr(file, "name", "stream")))
+
+    def lookahead(self, size: int) -> bytes:
+        """Up to size next bytes without moving the cursor,
+        may read beyond the buffer."""
+
+        data = self.peek(size)[:size]
+
+        if len(data) < size:
+            data += self.raw.peek(size - len(data))
+
+        return data
+
+
+class DecompressStream(RawIOBase):
+    """Compressed frames decompressed with large reads."""
+
+    def __init__(
+        self,
+        file: BufferedIOBase,
+        method: StreamMethod = StreamMethod.GZIP,
+        index: Optional[GzipIndex] = None,
+    ) -> None:
+        """Class initialization."""
+
+        self.file = file
+        self.method = method
+        self.index = index
+        self.start = file.tell()
+        self.rewind()
+
+    @property
+    def name(self) -> str:
+        """Name of the compressed file."""
+
+        return self.file.name
+
+    def rewind(self, point: Optional[SeekPoint] = None) -> None:
+        """Restart decompression from the first member
+        or from the seek point of the gzip index."""
+
+        if point:
+            self.file.seek(self.start + point.compressed)
+            self.decompressor = point.decompressor()
+            self.resumed = bool(point.window)
+            self.position = point.position
+        else:
+            self.file.seek(self.start)
+            self.decompressor = STREAM_DECOMPRESSORS[self.method]()
+            self.resumed = False
+            self.position = 0
+
+        self.started = self.resumed
+        self.tail = b""
+        self.data = b""
+        self.offset = 0
+
+    def skip_trailer(self, tail: bytes) -> bytes:
+        """Drop gzip trailer after the member resumed
+        without its header."""
+
+        while len(tail) < TRAILER_SIZE:
+            chunk = self.file.read(READ_SIZE)
+
+            if not chunk:
+                break
+
+            tail += chunk
+
+        return tail[TRAILER_SIZE:]
+
+    def decompress(self) -> bool:
+        """Decompress the next chunk, False at the end of the file."""
+
+        if self.decompressor.eof:
+            self.tail = (self.decompressor.unused_data or b"") + self.tail
+
+            if self.resumed:
+                self.tail = self.skip_trailer(self.tail)
+                self.resumed = False
+
+            self.decompressor = STREAM_DECOMPRESSORS[self.method]()
+            self.started = False
+
+        pending = (
+            self.method == StreamMethod.LZ4
+            and not self.decompressor.needs_input
+        )
+
+        if not self.tail and not pending:
+            self.tail = self.file.read(READ_SIZE)
+
+            if not self.tail:
+                if self.started:
+                    msg = "Compressed file ended before the end-of-stream"
+                    raise EOFError(msg)
+
+                return False
+
+        self.started = True
+        self.offset = 0
+
+        if self.method == StreamMethod.GZIP:
+            self.data = self.decompressor.decompress(self.tail, CHUNK_SIZE)
+            self.tail = self.decompressor.unconsumed_tail
+        elif self.method == StreamMethod.LZ4:
+            self.data = self.decompressor.decompress(self.tail, CHUNK_SIZE)
+            self.tail = b""
+        else:
+            self.data = self.zstd_decompress()
+
+        return True
+
+    def zstd_decompress(self) -> bytes:
+        """Decompress zstd by slices up to CHUNK_SIZE bytes, zstandard
+        decompressobj has no output limit."""
+
+        tail = memoryview(self.tail)
+        chunks: List[bytes] = []
+        size = 0
+        pos = 0
+
+        while pos < len(tail) and size < CHUNK_SIZE:
+            chunk = self.decompressor.decompress(tail[pos:pos + ZSTD_SLICE])
+            chunks.append(chunk)
+            size += len(chunk)
+            pos += ZSTD_SLICE
+
+            if self.decompressor.eof:
+                break
+
+        self.tail = tail[pos:]
+
+        return b"".join(chunks)
+
+    def readable(self) -> bool:
+        """Check readable."""
+
+        return True
+
+    def seekable(self) -> bool:
+        """Check seekable."""
+
+        return True
+
+    def tell(self) -> int:
+        """Position in decompressed data."""
+
+        return self.position
+
+    def readinto(self, buffer: memoryview) -> int:
+        """Read decompressed data into buffer."""
+
+        while self.offset >= len(self.data):
+            if not self.decompress():
+                return 0
+
+        size = min(len(buffer), len(self.data) - self.offset)
+        buffer[:size] = memoryview(self.data)[self.offset:self.offset + size]
+        self.offset += size
+        self.position += size
+
+        return size
+
+    def seek(
+        self,
+        position: int,
+        whence: int = 0,
+    ) -> int:
+        """Seek in decompressed data, backward seek beyond
+        the current chunk restarts decompression from the start
+        or from the nearest seek point of the gzip index."""
+
+        if whence == 1:
+            position += self.position
+        elif whence == 2:
+            raise ValueError("Seek from end not supported")
+
+        chunk_start = self.position - self.offset
+        chunk_end = chunk_start + len(self.data)
+        point = self.index.find(position) if self.index else None
+
+        if position < chunk_start or (point and point.position > chunk_end):
+            self.rewind(point)
+        elif position <= chunk_end:
+            self.offset = position - chunk_start
+            self.position = position
+
+        while self.position < position:
+            if self.offset >= len(self.data) and not self.decompress():
+                break
+
+            step = min(position - self.position, len(self.data) - self.offset)
+            self.offset += step
+            self.position += step
+
+        return self.position
+
+    def close(self) -> None:
+        """Close the compressed file."""
+
+        if not self.closed:
+            self.file.close()
+
+        super().close()
+
+
+class StreamReader(BufferedReader):
+    """Buffered reader of gzip, zstd or LZ4 frame file."""
+
+    def __init__(
+        self,
+        file: BufferedIOBase,
+        method: StreamMethod = StreamMethod.GZIP,
+        buffer_size: int = READ_SIZE,
+        index: Optional[GzipIndex] = None,
+    ) -> None:
+        """Class initialization."""
+
+        super().__init__(
+            DecompressStream(file, method, index),
+            buffer_size,
+        )
+        self.method = method
+
+
+class StreamWriter(BufferedIOBase):
+    """Writer packing independent gzip members, zstd or LZ4 frames
+    in a thread pool."""
+
+    def __init__(
+        self,
+        file: BufferedIOBase,
+        method: StreamMethod = StreamMethod.GZIP,
+        level: Optional[int] = None,
+        workers: int = 1,
+        frame_size: int = BLOCK_SIZE,
+    ) -> None:
+        """Class initialization."""
+
+        self.file = file
+        self.method = method
+        self.level = STREAM_LEVELS[method] if level is None else level
+        self.compressor = STREAM_COMPRESSORS[method]
+        self.frame_size = frame_size
+        self.write_buffer = bytearray()
+        self.members = 0
+        self.max_pending = workers * 2
+        self.pending: Deque[Future] = deque()
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+        if workers > 1:
+            self.executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="StreamWriter",
+            )
+
+    @property
+    def name(self) -> str:
+        """Name of the compressed file."""
+
+        return self.file.name
+
+    def writable(self) -> bool:
+        """Check writable."""
+
+        return True
+
+    def write_member(self, data: bytes) -> None:
+        """Compress one independent member or frame."""
+
+        self.members += 1
+
+        if not self.executor:
+            self.file.write(self.compressor(data, self.level))
+            return
+
+        while len(self.pending) >= self.max_pending:
+            self.file.write(self.pending.popleft().result())
+
+        self.pending.append(
+            self.executor.submit(self.compressor, data, self.level)
+        )
+
+    def write(
+        self,
+        buffer: Union[bytes, bytearray, memoryview],
+    ) -> int:
+        """Write func."""
+
+        self.write_buffer.extend(buffer)
+
+        if len(self.write_buffer) >= self.frame_size:
+            view = memoryview(self.write_buffer)
+            position = 0
+
+            while len(self.write_buffer) - position >= self.frame_size:
+                self.write_member(
+                    bytes(view[position:position + self.frame_size])
+                )
+                position += self.frame_size
+
+            view.release()
+            del self.write_buffer[:position]
+
+        return len(buffer)
+
+    def flush(self) -> None:
+        """Write all buffered data as members or frames."""
+
+        if self.write_buffer or not self.members:
+            self.write_member(bytes(self.write_buffer))
+            self.write_buffer.clear()
+
+        while self.pending:
+            self.file.write(self.pending.popleft().result())
+
+        self.file.flush()
+
+    def close(self) -> None:
+        """Close func."""
+
+        if self.closed:
+            return
+
+        try:
+            super().close()
+        finally:
+            if self.executor:
+                self.executor.shutdown(cancel_futures=True)
+
+            self.file.close()
+
+
+def forward_only(file: BufferedIOBase) -> bool:
+    """Check the file can be read only once from start to end."""
+
+    if isinstance(file, StreamReader):
+        file = file.raw.file
+
+    return isinstance(file, ForwardCursor)
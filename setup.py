@@ -9,7 +9,7 @@ with open(file="README.md", mode="r", encoding="utf-8",) as f:
     long_description = f.read()
 
 setup(name="native_transfer",
-      version="0.0.4",
+      version="0.0.5",
       packages=find_packages(),
       author="0xMihalich",
       author_email="bayanmobile87@gmail.com",
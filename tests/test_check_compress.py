@@ -0,0 +1,36 @@
+from io import BytesIO
+from struct import pack
+
+from pandas import DataFrame
+
+from native_transfer import (
+    CompressionMethod,
+    NativeTransfer,
+)
+from native_transfer.compress import NativeCompressFile
+
+
+def test_header_with_wrong_hash_is_not_compressed() -> None:
+    """A block header without a valid checksum keeps the file as is."""
+
+    file = BytesIO(b"\x01" * 16 + b"\x82" + pack("<2L", 9, 0))
+
+    assert NativeTransfer().check_compress(file) is file
+    assert file.tell() == 0
+
+
+def test_compressed_file_is_detected() -> None:
+    """A compressed Native file opens as NativeCompressFile."""
+
+    frame = DataFrame({"a": range(1000)})
+    file = BytesIO()
+    file.name = "compressed"
+    NativeTransfer(
+        make_compress=True,
+        compress_method=CompressionMethod.LZ4,
+    ).make(frame, file, dtypes=["Int64"])
+    file.seek(0)
+
+    base_file = NativeTransfer().check_compress(file)
+
+    assert isinstance(base_file, NativeCompressFile)
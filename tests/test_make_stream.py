@@ -0,0 +1,110 @@
+from io import BytesIO
+
+import polars as pl
+import pytest
+
+from native_transfer import (
+    FrameType,
+    NativeTransfer,
+    NativeWriteError,
+)
+
+
+class NamedBytesIO(BytesIO):
+    """In-memory file with a name like an open file."""
+
+    name = "memory"
+
+
+class BlocksClient:
+    """HttpInsert stand-in keeping the sent body."""
+
+    def __init__(self) -> None:
+        """Class initialization."""
+
+        self.body = b""
+
+    def insert(self, table, blocks, settings=None) -> str:
+        """Join the blocks instead of sending them."""
+
+        self.body = b"".join(blocks)
+
+        return ""
+
+
+def read_frame(data: bytes) -> pl.DataFrame:
+    """Read Native bytes into polars.DataFrame."""
+
+    return NativeTransfer().extract(NamedBytesIO(data), FrameType.Polars)
+
+
+def test_make_stream_string_lengths() -> None:
+    """Strings of the next batches may differ in length."""
+
+    batches = [
+        pl.DataFrame({"s": ["aa", "bb"]}),
+        pl.DataFrame({"s": ["ccc", "d"]}),
+    ]
+    file = NamedBytesIO()
+    NativeTransfer().make_stream(batches, file)
+
+    assert read_frame(file.getvalue())["s"].to_list() == [
+        "aa",
+        "bb",
+        "ccc",
+        "d",
+    ]
+
+
+def test_make_stream_late_nulls() -> None:
+    """NULL in a column inferred as not Nullable is an error."""
+
+    batches = [
+        pl.DataFrame({"n": [1, 2]}),
+        pl.DataFrame({"n": [None, 4]}),
+    ]
+
+    with pytest.raises(NativeWriteError):
+        NativeTransfer().make_stream(batches, NamedBytesIO())
+
+
+def test_insert_batches() -> None:
+    """Chunked insert of batches checks them like make_stream."""
+
+    client = BlocksClient()
+    NativeTransfer().insert(
+        [
+            pl.DataFrame({"s": ["aa", "bb"], "n": [1, 2]}),
+            pl.DataFrame({"s": ["ccc", "d"], "n": [3, 4]}),
+        ],
+        client,
+        "table",
+    )
+
+    assert read_frame(client.body)["s"].to_list() == [
+        "aa",
+        "bb",
+        "ccc",
+        "d",
+    ]
+
+    with pytest.raises(NativeWriteError):
+        NativeTransfer().insert(
+            [
+                pl.DataFrame({"s": ["aa", "bb"], "n": [1, 2]}),
+                pl.DataFrame({"s": ["ccc", "d"], "n": [None, 4]}),
+            ],
+            client,
+            "table",
+        )
+
+
+def test_fixed_string_length() -> None:
+    """FixedString rejects values of another length."""
+
+    with pytest.raises(NativeWriteError):
+        NativeTransfer().make(
+            pl.DataFrame({"s": ["aa", "bbb"]}),
+            NamedBytesIO(),
+            dtypes=["FixedString(2)"],
+        )
@@ -0,0 +1,48 @@
+from native_transfer.compress import (
+    BlockStruct,
+    CompressCodec,
+    CompressionMethod,
+)
+
+
+# T64 blocks in Clickhouse layout: MagicNumber with byte variant,
+# Int64/UInt64 min and max, then one 64 value matrix of byte planes
+UINT8_BLOCK = bytes.fromhex(
+    "01"
+    "0000000000000000"
+    "3f00000000000000"
+) + bytes(range(64))
+INT8_BLOCK = bytes.fromhex(
+    "06"
+    "e0ffffffffffffff"
+    "1f00000000000000"
+) + bytes(range(0xE0, 0x100)) + bytes(range(0x20))
+
+
+def test_t64_decompress_uint8() -> None:
+    """UInt8 block keeps unsigned values."""
+
+    block = BlockStruct.from_data(CompressionMethod.T64, 64, UINT8_BLOCK)
+
+    assert CompressCodec().decompress_block(block) == bytes(range(64))
+
+
+def test_t64_decompress_int8() -> None:
+    """Int8 block restores negative values."""
+
+    block = BlockStruct.from_data(CompressionMethod.T64, 64, INT8_BLOCK)
+    values = bytes(range(0xE0, 0x100)) + bytes(range(0x20))
+
+    assert CompressCodec().decompress_block(block) == values
+
+
+def test_t64_compress_uint8() -> None:
+    """UInt8 values are written with MagicNumber 1."""
+
+    block = CompressCodec().compress_block(
+        bytes(range(64)),
+        CompressionMethod.T64,
+        1,
+    )
+
+    assert block.compressed_data == UINT8_BLOCK